@@ -2,14 +2,50 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
+import os
+import pickle
+import re
+import sys
+import threading
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
 import jsonschema
 
-from .paths import expand_path
+from .paths import expand_path, user_cache_dir
+from .patterns import compile_union
+
+# orjson parses config files several times faster when it's installed; its
+# JSONDecodeError subclasses json.JSONDecodeError, so callers see no difference
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+# Log levels accepted by LoggingConfig (in severity order, for error messages)
+_LOG_LEVELS = ("TRACE", "DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+_VALID_LOG_LEVELS = frozenset(_LOG_LEVELS)
+
+_VALID_SCRIPT_TYPES = frozenset(("applescript", "python", "command"))
+
+# Set to "1" to keep a pickled copy of the parsed config between runs
+CONFIG_CACHE_ENV = "RAP_CONFIG_CACHE"
+
+# Bump whenever the config dataclasses change shape, to discard old caches
+_CONFIG_CACHE_VERSION = 3
+
+# (config, schema) raw contents that passed validation, oldest first
+_validated_contents: dict[tuple[bytes, bytes], None] = {}
+_validated_lock = threading.Lock()
+_VALIDATED_CONTENTS_MAX = 8
+
+
+def _intern(value: Any) -> Any:
+    """Intern a string config value, passing anything else through."""
+    return sys.intern(value) if isinstance(value, str) else value
 
 
 @dataclass
@@ -24,10 +60,22 @@ class WatchConfig:
     stability_check_seconds: float = 1.0
     stability_timeout_seconds: float = 60.0
 
+    # (base_folder, expanded Path) from the last expanded_base_folder lookup
+    _expanded_base_folder: tuple[str, Path] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     @property
     def expanded_base_folder(self) -> Path:
-        """Return base folder with ~ and ${VAR} expanded."""
-        return Path(expand_path(self.base_folder))
+        """Return base folder with ~ and ${VAR} expanded.
+
+        The expansion is cached and recomputed only if base_folder changes.
+        """
+        cached = self._expanded_base_folder
+        if cached is None or cached[0] != self.base_folder:
+            cached = (self.base_folder, Path(expand_path(self.base_folder)))
+            self._expanded_base_folder = cached
+        return cached[1]
 
 
 @dataclass
@@ -44,12 +92,55 @@ class ScriptConfig:
     include_paths: list[str] = field(default_factory=list)  # fnmatch patterns to include
     exclude_paths: list[str] = field(default_factory=list)  # fnmatch patterns to exclude
 
+    # (patterns, compiled regex) from the last compiled_*_paths lookup
+    _compiled_include: tuple[list[str], re.Pattern[str] | None] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _compiled_exclude: tuple[list[str], re.Pattern[str] | None] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     def __post_init__(self) -> None:
-        if self.type not in ("applescript", "python", "command"):
+        if self.type not in _VALID_SCRIPT_TYPES:
             raise ValueError(
                 f"Invalid script type: {self.type}. "
                 "Must be 'applescript', 'python', or 'command'"
             )
+        # Configs repeat the same strings across scripts and watchers; interning
+        # shares one object per distinct value
+        self.type = _intern(self.type)
+        self.cwd = _intern(self.cwd)
+        self.include_paths = [_intern(p) for p in self.include_paths]
+        self.exclude_paths = [_intern(p) for p in self.exclude_paths]
+
+    @property
+    def has_path_filters(self) -> bool:
+        """Return whether any include or exclude patterns are set."""
+        return bool(self.include_paths or self.exclude_paths)
+
+    @property
+    def compiled_include_paths(self) -> re.Pattern[str] | None:
+        """Return include_paths as one regex, or None if there are none.
+
+        The regex is cached and recompiled only if include_paths changes.
+        """
+        cached = self._compiled_include
+        if cached is None or cached[0] != self.include_paths:
+            cached = (list(self.include_paths), compile_union(self.include_paths))
+            self._compiled_include = cached
+        return cached[1]
+
+    @property
+    def compiled_exclude_paths(self) -> re.Pattern[str] | None:
+        """Return exclude_paths as one regex, or None if there are none.
+
+        The regex is cached and recompiled only if exclude_paths changes.
+        """
+        cached = self._compiled_exclude
+        if cached is None or cached[0] != self.exclude_paths:
+            cached = (list(self.exclude_paths), compile_union(self.exclude_paths))
+            self._compiled_exclude = cached
+        return cached[1]
 
 
 @dataclass
@@ -75,15 +166,26 @@ class LoggingConfig:
     max_bytes: int = 10485760  # 10MB
     backup_count: int = 5
 
+    # (file, expanded Path) from the last expanded_file lookup
+    _expanded_file: tuple[str, Path] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     @property
     def expanded_file(self) -> Path:
-        """Return log file path with ~ and ${VAR} expanded."""
-        return Path(expand_path(self.file))
+        """Return log file path with ~ and ${VAR} expanded.
+
+        The expansion is cached and recomputed only if file changes.
+        """
+        cached = self._expanded_file
+        if cached is None or cached[0] != self.file:
+            cached = (self.file, Path(expand_path(self.file)))
+            self._expanded_file = cached
+        return cached[1]
 
     def __post_init__(self) -> None:
-        valid_levels = ("TRACE", "DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
-        if self.level.upper() not in valid_levels:
-            raise ValueError(f"Invalid log level: {self.level}. Must be one of {valid_levels}")
+        if self.level.upper() not in _VALID_LOG_LEVELS:
+            raise ValueError(f"Invalid log level: {self.level}. Must be one of {_LOG_LEVELS}")
 
 
 @dataclass
@@ -122,6 +224,7 @@ class WatcherConfig:
             raise ValueError(
                 f"Invalid trigger: {self.trigger}. Must be 'auto' or 'manual'"
             )
+        self.name = _intern(self.name)
 
     @property
     def should_archive(self) -> bool:
@@ -153,6 +256,34 @@ class Config:
         """Return only enabled watchers."""
         return [w for w in self.watchers if w.enabled]
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> Config:
+        """Build a Config from already-parsed config.json data.
+
+        Unlike load_config(), this does no file I/O or JSON schema validation.
+
+        Args:
+            data: Parsed config data
+
+        Returns:
+            Parsed Config object
+
+        Raises:
+            ValueError: If config is missing required fields
+        """
+        # Legacy validation (kept for backwards compatibility with configs without schema)
+        if "watchers" not in data:
+            raise ValueError("Config must have a 'watchers' array")
+
+        if not isinstance(data["watchers"], list) or len(data["watchers"]) == 0:
+            raise ValueError("Config 'watchers' must be a non-empty array")
+
+        return cls(
+            watchers=[_parse_watcher_config(w) for w in data["watchers"]],
+            logging=_parse_logging_config(data.get("logging")),
+            notifications=_parse_notifications_config(data.get("notifications")),
+        )
+
 
 def _parse_watch_config(data: dict[str, Any]) -> WatchConfig:
     """Parse watch configuration from dict."""
@@ -245,20 +376,53 @@ def _parse_watcher_config(data: dict[str, Any]) -> WatcherConfig:
     )
 
 
-def _load_schema(config_path: Path) -> dict[str, Any] | None:
-    """Load JSON schema from config directory.
+def _read_schema(config_path: Path) -> bytes | None:
+    """Read the JSON schema file from the config directory.
 
     Args:
         config_path: Path to config.json file
 
     Returns:
-        Schema dict if found, None otherwise
+        Raw schema file contents if found, None otherwise
     """
     schema_path = config_path.parent / "config.schema.json"
-    if schema_path.exists():
-        with open(schema_path) as f:
-            return json.load(f)
-    return None
+    try:
+        return schema_path.read_bytes()
+    except FileNotFoundError:
+        return None
+
+
+def _check_schema(
+    data: dict[str, Any], config_raw: bytes, schema_raw: bytes, config_path: Path
+) -> None:
+    """Validate a parsed config against a raw schema, once per version.
+
+    Schema validation is the expensive part of loading. Keying the check on
+    the exact file contents means a reload of an unchanged config skips it,
+    while any edit is validated again. Failures raise and are not recorded.
+
+    Args:
+        data: Parsed config.json contents
+        config_raw: Raw config.json contents data was parsed from
+        schema_raw: Raw config.schema.json contents
+        config_path: Path to config file (for error messages)
+
+    Raises:
+        ValueError: If validation fails
+    """
+    key = (config_raw, schema_raw)
+    with _validated_lock:
+        if key in _validated_contents:
+            return
+
+    schema = _json_loads(schema_raw)
+    if schema:
+        _validate_schema(data, schema, config_path)
+
+    with _validated_lock:
+        _validated_contents[key] = None
+        if len(_validated_contents) > _VALIDATED_CONTENTS_MAX:
+            del _validated_contents[next(iter(_validated_contents))]
 
 
 def _validate_schema(data: dict[str, Any], schema: dict[str, Any], config_path: Path) -> None:
@@ -287,6 +451,10 @@ def _validate_schema(data: dict[str, Any], schema: dict[str, Any], config_path:
 def load_config(config_path: str | Path) -> Config:
     """Load configuration from a JSON file.
 
+    With RAP_CONFIG_CACHE=1 in the environment, the parsed Config is also
+    pickled to a cache file and reused by later runs while config.json and
+    config.schema.json are unchanged, skipping parsing and validation.
+
     Args:
         config_path: Path to the config.json file
 
@@ -300,31 +468,98 @@ def load_config(config_path: str | Path) -> Config:
     """
     config_path = Path(config_path)
 
-    if not config_path.exists():
-        raise FileNotFoundError(f"Config file not found: {config_path}")
+    try:
+        raw = config_path.read_bytes()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Config file not found: {config_path}") from None
+
+    schema_raw = _read_schema(config_path)
 
-    with open(config_path) as f:
-        data = json.load(f)
+    cache_path: Path | None = None
+    digest = ""
+    if os.environ.get(CONFIG_CACHE_ENV) == "1":
+        cache_path = _config_cache_path(config_path)
+        digest = _config_digest(raw, schema_raw)
+        cached = _read_config_cache(cache_path, digest)
+        if cached is not None:
+            return cached
+
+    data = _json_loads(raw)
 
     # Validate against JSON schema if available
-    schema = _load_schema(config_path)
-    if schema:
-        _validate_schema(data, schema, config_path)
+    if schema_raw is not None:
+        _check_schema(data, raw, schema_raw, config_path)
 
-    # Legacy validation (kept for backwards compatibility with configs without schema)
-    if "watchers" not in data:
-        raise ValueError("Config must have a 'watchers' array")
+    config = Config.from_dict(data)
+    if cache_path is not None:
+        _write_config_cache(cache_path, digest, config)
+    return config
 
-    if not isinstance(data["watchers"], list) or len(data["watchers"]) == 0:
-        raise ValueError("Config 'watchers' must be a non-empty array")
 
-    watchers = [_parse_watcher_config(w) for w in data["watchers"]]
+def _config_cache_path(config_path: Path) -> Path:
+    """Get the sidecar cache file for a config file.
 
-    return Config(
-        watchers=watchers,
-        logging=_parse_logging_config(data.get("logging")),
-        notifications=_parse_notifications_config(data.get("notifications")),
-    )
+    Caches live in the user cache folder ($XDG_CACHE_HOME, or
+    ~/Library/Caches), never next to config.json, so a shared or read-only
+    config folder is never written to.
+
+    Args:
+        config_path: Path to config.json file
+
+    Returns:
+        Cache file path, unique per absolute config path
+    """
+    name = hashlib.sha256(str(config_path.resolve()).encode()).hexdigest()[:16]
+    return user_cache_dir() / f"config-{name}.cache"
+
+
+def _config_digest(config_raw: bytes, schema_raw: bytes | None) -> str:
+    """Hash the config and schema contents a cached Config was built from."""
+    digest = hashlib.sha256(config_raw)
+    if schema_raw is not None:
+        digest.update(b"\0")
+        digest.update(schema_raw)
+    return digest.hexdigest()
+
+
+def _read_config_cache(cache_path: Path, digest: str) -> Config | None:
+    """Load a cached Config if it was built from the current files.
+
+    Args:
+        cache_path: Cache file path
+        digest: Digest of the current config and schema contents
+
+    Returns:
+        Cached Config, or None if missing, stale, or unreadable
+    """
+    try:
+        with cache_path.open("rb") as f:
+            version, cached_digest, config = pickle.load(f)
+    except Exception:
+        # Missing, truncated, or written by an incompatible version
+        return None
+    if version != _CONFIG_CACHE_VERSION or cached_digest != digest:
+        return None
+    return config if isinstance(config, Config) else None
+
+
+def _write_config_cache(cache_path: Path, digest: str, config: Config) -> None:
+    """Write a Config to its cache file, ignoring failures.
+
+    Args:
+        cache_path: Cache file path
+        digest: Digest of the config and schema contents config was built from
+        config: Freshly parsed Config (before any derived paths are expanded,
+            since those depend on the environment of the current run)
+    """
+    payload = pickle.dumps((_CONFIG_CACHE_VERSION, digest, config), pickle.HIGHEST_PROTOCOL)
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_bytes(payload)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
 
 
 def find_config_file(start_path: Path | None = None) -> Path:
@@ -342,16 +577,10 @@ def find_config_file(start_path: Path | None = None) -> Path:
     if start_path is None:
         start_path = Path.cwd()
 
-    current = start_path
-    while current != current.parent:
-        config_path = current / "config" / "config.json"
-        if config_path.exists():
+    # start_path.parents ends at the root, so the root is checked too
+    for directory in (start_path, *start_path.parents):
+        config_path = directory / "config" / "config.json"
+        if os.path.isfile(config_path):
             return config_path
-        current = current.parent
-
-    # Check root too
-    config_path = current / "config" / "config.json"
-    if config_path.exists():
-        return config_path
 
     raise FileNotFoundError("No config/config.json found in current directory or parents")
@@ -4,10 +4,13 @@ from __future__ import annotations
 
 import os
 import shlex
+import string
 import subprocess
 import sys
 import time
+from collections.abc import Mapping
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -22,6 +25,11 @@ logger = get_logger("executor")
 # Default timeout for script execution (5 minutes)
 DEFAULT_TIMEOUT = 300
 
+_FORMATTER = string.Formatter()
+
+# Variables removed from the environment of command-type scripts
+_COMMAND_ENV_EXCLUDED = frozenset(("VIRTUAL_ENV", "PYTHONPATH", "PYTHONHOME", "CONDA_PREFIX"))
+
 
 @dataclass
 class ExecutionResult:
@@ -38,9 +46,13 @@ class ExecutionResult:
         return f"{status} in {self.duration_ms}ms"
 
 
-@dataclass
+@dataclass(slots=True)
 class FileVariables:
-    """Variables available for script argument substitution."""
+    """Variables available for script argument substitution.
+
+    Built once per processed file, so instances use __slots__ (no per-instance
+    __dict__).
+    """
 
     file_path: str  # Full POSIX path
     relative_path: str  # Path relative to watch folder
@@ -67,35 +79,37 @@ class FileVariables:
         Returns:
             FileVariables with all computed values
         """
-        # Get relative path
-        try:
-            relative = file_path.relative_to(base_folder)
-        except ValueError:
-            # File not in base folder, use full path as relative
-            relative = file_path
-
-        parts = relative.parts
-        filename = relative.name
-
-        # Parse database and group path
-        if len(parts) >= 2:
-            database = parts[0]
-            # Group path is everything between database and filename
-            if len(parts) > 2:
-                group_path = "/".join(parts[1:-1])
-            else:
-                group_path = ""
+        file_str = str(file_path)
+        base_str = str(base_folder)
+        prefix = os.path.join(base_str, "")
+
+        if file_str.startswith(prefix):
+            # Common case: slice the relative path instead of building
+            # PurePath objects. "DB/Group/Sub/file.pdf" splits into the
+            # database, the group path between it and the filename, and the
+            # filename.
+            relative = file_str[len(prefix):]
+            head, _, filename = relative.rpartition("/")
+            database, _, group_path = head.partition("/")
         else:
-            database = ""
-            group_path = ""
+            try:
+                relative_path = file_path.relative_to(base_folder)
+            except ValueError:
+                # File not in base folder, use full path as relative
+                relative_path = file_path
+            relative = str(relative_path)
+            parts = relative_path.parts
+            filename = relative_path.name
+            database = parts[0] if len(parts) >= 2 else ""
+            group_path = "/".join(parts[1:-1]) if len(parts) > 2 else ""
 
         return cls(
-            file_path=str(file_path),
-            relative_path=str(relative),
+            file_path=file_str,
+            relative_path=relative,
             filename=filename,
             database=database,
             group_path=group_path,
-            base_folder=str(base_folder),
+            base_folder=base_str,
             log_level=log_level,
         )
 
@@ -112,7 +126,7 @@ class FileVariables:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ManualVariables:
     """Variables available for manual trigger script argument substitution.
 
@@ -151,6 +165,82 @@ class ManualVariables:
         }
 
 
+@lru_cache(maxsize=256)
+def _resolve_script_path(project_root: Path, path: str) -> Path:
+    """Resolve a script path against a project root (memoized per pair)."""
+    script_path = Path(path)
+    if script_path.is_absolute():
+        return script_path
+    return project_root / script_path
+
+
+@lru_cache(maxsize=1024)
+def _compile_template(template: str) -> tuple[tuple[str, str | None], ...] | None:
+    """Split a str.format() template into (literal, field_name) pieces.
+
+    Args:
+        template: Argument template with {variable} placeholders
+
+    Returns:
+        Pieces to interpolate, or None if the template uses format specs,
+        conversions, or indexing, which are left to str.format()
+
+    Raises:
+        ValueError: If the template has unbalanced braces
+    """
+    pieces = []
+    for literal, field_name, format_spec, conversion in _FORMATTER.parse(template):
+        if field_name is not None and (
+            format_spec or conversion or not field_name.isidentifier()
+        ):
+            return None
+        pieces.append((literal, field_name))
+    return tuple(pieces)
+
+
+def _render_template(template: str, var_dict: Mapping[str, str]) -> str:
+    """Substitute variables into a template, same as template.format(**var_dict).
+
+    Raises:
+        KeyError: If the template references a variable not in var_dict
+        ValueError: If the template has unbalanced braces
+    """
+    pieces = _compile_template(template)
+    if pieces is None:
+        return template.format(**var_dict)
+    return "".join(
+        literal if name is None else literal + var_dict[name] for literal, name in pieces
+    )
+
+
+def _decode_output(data: bytes | None) -> str:
+    """Decode captured script output.
+
+    Output is decoded as UTF-8 in one call, with invalid bytes replaced
+    rather than failing the script, and newlines normalized the same way
+    text-mode pipes would.
+    """
+    if not data:
+        return ""
+    text = data.decode("utf-8", errors="replace")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+@lru_cache(maxsize=256)
+def _split_command(command: str) -> tuple[str, ...]:
+    """Split a command string like a shell would (memoized per command).
+
+    Commands without {variable} placeholders are identical for every file,
+    so they are only tokenized once.
+
+    Raises:
+        ValueError: If the command has unbalanced quotes
+    """
+    return tuple(shlex.split(command))
+
+
 class ScriptExecutor:
     """Executes AppleScript or Python scripts."""
 
@@ -182,8 +272,8 @@ class ScriptExecutor:
 
         # Substitute variables in args, path, and cwd
         try:
-            substituted_args = self._substitute_args(script.args, variables)
             var_dict = variables.as_dict()
+            substituted_args = self._substitute_args(script.args, variables, var_dict)
 
             # Handle command type separately (path is a command string, not a file)
             if script.type == "command":
@@ -234,10 +324,7 @@ class ScriptExecutor:
         Returns:
             Resolved absolute path
         """
-        script_path = Path(path)
-        if script_path.is_absolute():
-            return script_path
-        return self.project_root / script_path
+        return _resolve_script_path(self.project_root, path)
 
     def _substitute_string(
         self,
@@ -260,10 +347,10 @@ class ScriptExecutor:
         # would interpret {VAR} inside ${VAR} as a runtime placeholder)
         value = expand_path(value)
 
-        available_vars = ", ".join(f"{{{k}}}" for k in sorted(var_dict.keys()))
         try:
-            return value.format(**var_dict)
+            return _render_template(value, var_dict)
         except KeyError as e:
+            available_vars = ", ".join(f"{{{k}}}" for k in sorted(var_dict.keys()))
             unknown_var = str(e).strip("'")
             raise ValueError(
                 f"Unknown variable '{{{unknown_var}}}' in: {value}\n"
@@ -274,12 +361,14 @@ class ScriptExecutor:
         self,
         args: dict[str, str] | list[str],
         variables: FileVariables,
+        var_dict: dict[str, str] | None = None,
     ) -> dict[str, str] | list[str]:
         """Substitute variables in script arguments.
 
         Args:
             args: Original arguments
             variables: Variables for substitution
+            var_dict: variables.as_dict(), if the caller already built it
 
         Returns:
             Arguments with variables substituted
@@ -287,16 +376,17 @@ class ScriptExecutor:
         Raises:
             ValueError: If an unknown variable is referenced
         """
-        var_dict = variables.as_dict()
-        available_vars = ", ".join(f"{{{k}}}" for k in sorted(var_dict.keys()))
+        if var_dict is None:
+            var_dict = variables.as_dict()
 
         def substitute(value: str) -> str:
             # First expand ${VAR} env vars (must happen before .format() which
             # would interpret {VAR} inside ${VAR} as a runtime placeholder)
             value = expand_path(value)
             try:
-                return value.format(**var_dict)
+                return _render_template(value, var_dict)
             except KeyError as e:
+                available_vars = ", ".join(f"{{{k}}}" for k in sorted(var_dict.keys()))
                 unknown_var = str(e).strip("'")
                 raise ValueError(
                     f"Unknown variable '{{{unknown_var}}}' in argument: {value}\n"
@@ -394,7 +484,7 @@ class ScriptExecutor:
         """
         # Parse command string into list (handles quotes, spaces correctly)
         try:
-            cmd = shlex.split(command_str)
+            cmd = list(_split_command(command_str))
         except ValueError as e:
             return ExecutionResult(
                 success=False,
@@ -425,18 +515,16 @@ class ScriptExecutor:
                     duration_ms=0,
                 )
 
-        # Create clean environment without Python/virtualenv variables
-        # This allows tools like 'uv' to use their own project's environment
-        clean_env = {
-            k: v for k, v in os.environ.items()
-            if k not in ("VIRTUAL_ENV", "PYTHONPATH", "PYTHONHOME", "CONDA_PREFIX")
-        }
-
         if resolved_cwd:
             logger.debug(f"Executing (cwd={resolved_cwd}): {' '.join(cmd)}")
         else:
             logger.debug(f"Executing: {' '.join(cmd)}")
 
+        # Clear Python/virtualenv variables from the live environment, so tools
+        # like 'uv' use their own project's environment
+        clean_env = {
+            k: v for k, v in os.environ.items() if k not in _COMMAND_ENV_EXCLUDED
+        }
         return self._run_subprocess(cmd, timeout, cwd=resolved_cwd, env=clean_env)
 
     def _run_subprocess(
@@ -463,7 +551,6 @@ class ScriptExecutor:
             result = subprocess.run(
                 cmd,
                 capture_output=True,
-                text=True,
                 timeout=timeout,
                 cwd=cwd,
                 env=env,
@@ -471,13 +558,14 @@ class ScriptExecutor:
 
             duration_ms = int((time.time() - start_time) * 1000)
 
-            stderr_content = result.stderr.strip() if result.stderr else ""
+            stdout_content = _decode_output(result.stdout).strip()
+            stderr_content = _decode_output(result.stderr).strip()
 
             if result.returncode == 0:
-                logger.trace(f"stdout: {result.stdout.strip()}")  # type: ignore[attr-defined]
+                logger.trace(f"stdout: {stdout_content}")  # type: ignore[attr-defined]
                 return ExecutionResult(
                     success=True,
-                    output=result.stdout.strip(),
+                    output=stdout_content,
                     error=None,
                     duration_ms=duration_ms,
                     stderr=stderr_content,
@@ -487,7 +575,7 @@ class ScriptExecutor:
                 logger.debug(f"Script failed: {error_msg}")
                 return ExecutionResult(
                     success=False,
-                    output=result.stdout.strip(),
+                    output=stdout_content,
                     error=error_msg,
                     duration_ms=duration_ms,
                     stderr=stderr_content,
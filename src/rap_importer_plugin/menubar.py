@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import subprocess
 import threading
+from functools import partial
 from pathlib import Path
 from typing import TYPE_CHECKING, Callable
 
@@ -42,17 +43,15 @@ class RAPImporterMenuBar(rumps.App):
         self.log_path = log_path
         self.on_quit = on_quit
         self.on_startup = on_startup
-        self._startup_done = False
+        self._startup_done = threading.Event()  # Set once on_startup has been dispatched
         self._last_count = 0
-        self._last_counts: dict[str, int] = {}
         self._last_failed_count = 0
         self._last_active_count = 0
         self._retry_pending = 0  # Track files pending in retry queue
-        self._retry_lock = threading.Lock()
         self._startup_pending = 0  # Track files pending at startup
-        self._startup_lock = threading.Lock()
         self._manual_pending = 0  # Track manual pipeline runs in progress
-        self._manual_lock = threading.Lock()
+        self._pending_max = 0  # Highest of the three pending counters
+        self._pending_lock = threading.Lock()  # Guards all pending counters
 
         # Separate auto and manual watchers
         self._auto_watchers = [w for w in watcher_instances if not w.is_manual]
@@ -61,6 +60,10 @@ class RAPImporterMenuBar(rumps.App):
         # Build menu
         self._build_menu()
 
+        # One-shot timer to run deferred startup once the menu bar is visible
+        self._startup_timer_obj = rumps.Timer(self._startup_timer, 0.5)
+        self._startup_timer_obj.start()
+
         logger.debug(f"Menu bar app initialized with {len(watcher_instances)} watchers")
         logger.debug(f"Auto watchers: {len(self._auto_watchers)}, Manual watchers: {len(self._manual_watchers)}")
         if self._manual_watchers:
@@ -68,16 +71,22 @@ class RAPImporterMenuBar(rumps.App):
 
     def set_startup_pending(self, count: int) -> None:
         """Set the number of files pending at startup."""
-        with self._startup_lock:
+        with self._pending_lock:
             self._startup_pending = count
+            self._update_pending_max()
         logger.info(f"Set _startup_pending = {count}")
 
     def decrement_startup_pending(self) -> None:
         """Decrement the startup pending counter."""
-        with self._startup_lock:
+        with self._pending_lock:
             self._startup_pending = max(0, self._startup_pending - 1)
             remaining = self._startup_pending
-        logger.debug(f"Decremented _startup_pending to {remaining}")
+            self._update_pending_max()
+        logger.debug("Decremented _startup_pending to %d", remaining)
+
+    def _update_pending_max(self) -> None:
+        """Recompute the cached pending maximum (caller holds _pending_lock)."""
+        self._pending_max = max(self._retry_pending, self._startup_pending, self._manual_pending)
 
     def _build_menu(self) -> None:
         """Build the menu structure."""
@@ -94,21 +103,30 @@ class RAPImporterMenuBar(rumps.App):
             item = rumps.MenuItem(f"  {instance.name}: 0")
             self.watcher_items[instance.name] = item
 
+        # Positional views of the watcher items for the 1-second timer.
+        # Watchers are fixed at construction, so index i always refers to
+        # the same pipeline, menu item, and title prefix.
+        self._pipelines = [inst.pipeline for inst in self.watcher_instances]
+        self._watcher_item_list = [self.watcher_items[inst.name] for inst in self.watcher_instances]
+        self._title_prefix_list = [f"  {inst.name}: " for inst in self.watcher_instances]
+        self._last_counts_list = [0] * len(self.watcher_instances)
+        self._last_failed_list = [0] * len(self.watcher_instances)
+
         # Run Manual submenu (only if there are manual watchers)
         self.manual_submenu: rumps.MenuItem | None = None
         if self._manual_watchers:
             self.manual_submenu = rumps.MenuItem("Run Manual")
-            for instance in self._manual_watchers:
-                callback = self._create_manual_callback(instance)
-                item = rumps.MenuItem(instance.name, callback=callback)
-                self.manual_submenu.add(item)
+            self.manual_submenu.update([
+                rumps.MenuItem(instance.name, callback=partial(self._run_manual, instance))
+                for instance in self._manual_watchers
+            ])
 
         # Open Directory submenu (for all watchers)
         self.open_dir_submenu = rumps.MenuItem("Open Directory")
-        for instance in self.watcher_instances:
-            callback = self._create_open_directory_callback(instance)
-            item = rumps.MenuItem(instance.name, callback=callback)
-            self.open_dir_submenu.add(item)
+        self.open_dir_submenu.update([
+            rumps.MenuItem(instance.name, callback=partial(self._open_directory, instance))
+            for instance in self.watcher_instances
+        ])
 
         # Retry failed files
         self.retry_item = rumps.MenuItem("Retry - 0", callback=self._retry)
@@ -123,14 +141,10 @@ class RAPImporterMenuBar(rumps.App):
         menu_items: list[rumps.MenuItem | None] = [
             self.status_item,
             self.counter_item,
+            *self.watcher_items.values(),
+            None,  # Separator
         ]
 
-        # Add watcher items
-        for item in self.watcher_items.values():
-            menu_items.append(item)
-
-        menu_items.append(None)  # Separator
-
         # Add Run Manual submenu if there are manual watchers
         if self.manual_submenu:
             menu_items.append(self.manual_submenu)
@@ -146,15 +160,17 @@ class RAPImporterMenuBar(rumps.App):
 
         self.menu = menu_items
 
-    @rumps.timer(0.5)
-    def _startup_timer(self, sender: rumps.Timer) -> None:
-        """Run startup callback once after menu bar is visible."""
-        if self._startup_done:
-            sender.stop()
-            return
+    def _startup_timer(self, _sender: rumps.Timer) -> None:
+        """Run startup callback once after menu bar is visible.
 
-        self._startup_done = True
-        sender.stop()
+        The timer is stopped before anything else, and the event guarantees
+        the callback runs at most once even if a second fire was already
+        queued.
+        """
+        self._startup_timer_obj.stop()
+        if self._startup_done.is_set():
+            return
+        self._startup_done.set()
 
         if self.on_startup:
             logger.debug("Running deferred startup callback")
@@ -165,72 +181,71 @@ class RAPImporterMenuBar(rumps.App):
         """Periodically update the file counters and menu bar title."""
         # Update menu bar title based on active processing + retry/startup/manual pending
         active = sum(inst.pipeline.active_processing for inst in self.watcher_instances)
-        with self._retry_lock:
-            retry_pending = self._retry_pending
-        with self._startup_lock:
-            startup_pending = self._startup_pending
-        with self._manual_lock:
-            manual_pending = self._manual_pending
-        # Show the highest of active, retry_pending, startup_pending, or manual_pending
-        display_count = max(active, retry_pending, startup_pending, manual_pending)
+        # Show the highest of active or any pending counter (maintained by the mutators)
+        display_count = max(active, self._pending_max)
         if display_count != self._last_active_count:
             self._last_active_count = display_count
             if display_count > 0:
                 self.title = f"RAP ({display_count})"
-                logger.debug(f"Processing {display_count} file(s) (active={active}, retry={retry_pending}, startup={startup_pending}, manual={manual_pending})")
+                logger.debug(
+                    "Processing %d file(s) (active=%d, retry=%d, startup=%d, manual=%d)",
+                    display_count, active, self._retry_pending,
+                    self._startup_pending, self._manual_pending,
+                )
             else:
                 self.title = "RAP"
                 logger.debug("Processing complete, title reset")
 
-        # Calculate aggregate count
-        total = sum(inst.pipeline.files_processed for inst in self.watcher_instances)
-
-        if total != self._last_count:
-            self._last_count = total
+        # Update individual watcher counts, folding each change into the
+        # aggregate totals instead of re-summing every watcher per tick
+        total_changed = False
+        failed_changed = False
+        for i, pipeline in enumerate(self._pipelines):
+            count = pipeline.files_processed
+            prev = self._last_counts_list[i]
+            if prev != count:
+                self._last_counts_list[i] = count
+                self._watcher_item_list[i].title = self._title_prefix_list[i] + str(count)
+                self._last_count += count - prev
+                total_changed = True
+
+            failed = pipeline.failed_count
+            prev_failed = self._last_failed_list[i]
+            if prev_failed != failed:
+                self._last_failed_list[i] = failed
+                self._last_failed_count += failed - prev_failed
+                failed_changed = True
+
+        if total_changed:
+            total = self._last_count
             self.counter_item.title = f"Files processed: {total}"
-            logger.debug(f"Updated total counter: {total}")
-
-        # Update individual watcher counts
-        for instance in self.watcher_instances:
-            count = instance.pipeline.files_processed
-            if self._last_counts.get(instance.name) != count:
-                self._last_counts[instance.name] = count
-                self.watcher_items[instance.name].title = f"  {instance.name}: {count}"
+            logger.debug("Updated total counter: %d", total)
 
         # Update failed files count
-        failed_count = sum(
-            len(inst.pipeline.get_failed_files()) for inst in self.watcher_instances
-        )
-        if failed_count != self._last_failed_count:
-            self._last_failed_count = failed_count
+        if failed_changed:
+            failed_count = self._last_failed_count
             self.retry_item.title = f"Retry - {failed_count}"
-            logger.debug(f"Updated failed counter: {failed_count}")
-
-    def _create_manual_callback(self, instance: WatcherInstance) -> Callable:
-        """Create a callback function for a manual watcher menu item.
+            logger.debug("Updated failed counter: %d", failed_count)
 
-        Args:
-            instance: The watcher instance to run
-
-        Returns:
-            Callback function for rumps MenuItem
-        """
-        def callback(_sender: rumps.MenuItem) -> None:
-            self._run_manual(instance)
-        return callback
-
-    def _run_manual(self, instance: WatcherInstance) -> None:
+    def _run_manual(
+        self, instance: WatcherInstance, _sender: rumps.MenuItem | None = None
+    ) -> None:
         """Run a manual pipeline in a background thread.
 
+        Bound to a menu item via functools.partial, so rumps passes the
+        clicked item as the trailing sender argument.
+
         Args:
             instance: The watcher instance to run
+            _sender: Menu item that triggered the run (unused)
         """
         logger.info(f"Running manual pipeline: {instance.name}")
 
         # Set manual pending count for menu bar display
-        with self._manual_lock:
+        with self._pending_lock:
             self._manual_pending += 1
-        logger.debug(f"Set _manual_pending = {self._manual_pending}")
+            self._update_pending_max()
+        logger.debug("Set _manual_pending = %d", self._manual_pending)
 
         # Capture self reference for closure
         menu_bar = self
@@ -240,31 +255,22 @@ class RAPImporterMenuBar(rumps.App):
                 instance.pipeline.run_manual()
             finally:
                 # Always decrement pending count, even on error
-                with menu_bar._manual_lock:
+                with menu_bar._pending_lock:
                     menu_bar._manual_pending = max(0, menu_bar._manual_pending - 1)
-                    logger.debug(f"Decremented _manual_pending to {menu_bar._manual_pending}")
+                    menu_bar._update_pending_max()
+                    logger.debug("Decremented _manual_pending to %d", menu_bar._manual_pending)
 
         thread = threading.Thread(target=do_manual, daemon=True)
         thread.start()
 
-    def _create_open_directory_callback(self, instance: WatcherInstance) -> Callable:
-        """Create a callback function to open a watcher's base folder in Finder.
-
-        Args:
-            instance: The watcher instance whose folder to open
-
-        Returns:
-            Callback function for rumps MenuItem
-        """
-        def callback(_sender: rumps.MenuItem) -> None:
-            self._open_directory(instance)
-        return callback
-
-    def _open_directory(self, instance: WatcherInstance) -> None:
+    def _open_directory(
+        self, instance: WatcherInstance, _sender: rumps.MenuItem | None = None
+    ) -> None:
         """Open a watcher's base folder in Finder.
 
         Args:
             instance: The watcher instance whose folder to open
+            _sender: Menu item that triggered the action (unused)
         """
         folder_path = instance.config.watch.expanded_base_folder
         logger.debug(f"Opening directory: {folder_path}")
@@ -294,8 +300,9 @@ class RAPImporterMenuBar(rumps.App):
             instance.pipeline.reset_failures()
 
         # Set retry pending count for menu bar display
-        with self._retry_lock:
+        with self._pending_lock:
             self._retry_pending = len(files_to_retry)
+            self._update_pending_max()
         logger.info(f"Set _retry_pending = {len(files_to_retry)}")
 
         # Re-dispatch each file through the normal watcher callback (same as watchdog)
@@ -305,14 +312,15 @@ class RAPImporterMenuBar(rumps.App):
 
         def do_retry() -> None:
             for i, (instance, file_path) in enumerate(files_to_retry, 1):
-                logger.debug(f"Retry processing file {i}/{len(files_to_retry)}: {file_path.name}")
+                logger.debug("Retry processing file %d/%d: %s", i, len(files_to_retry), file_path.name)
                 try:
                     instance.pipeline.process_file(file_path)
                 finally:
                     # Always decrement pending count, even on error
-                    with menu_bar._retry_lock:
+                    with menu_bar._pending_lock:
                         menu_bar._retry_pending = max(0, menu_bar._retry_pending - 1)
-                        logger.debug(f"Decremented _retry_pending to {menu_bar._retry_pending}")
+                        menu_bar._update_pending_max()
+                        logger.debug("Decremented _retry_pending to %d", menu_bar._retry_pending)
 
         thread = threading.Thread(target=do_retry, daemon=True)
         thread.start()
@@ -323,7 +331,8 @@ class RAPImporterMenuBar(rumps.App):
         try:
             subprocess.run(
                 ["open", "-a", "Console", str(self.log_path)],
-                capture_output=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
                 check=True,
             )
         except subprocess.CalledProcessError as e:
@@ -332,7 +341,8 @@ class RAPImporterMenuBar(rumps.App):
             try:
                 subprocess.run(
                     ["open", str(self.log_path)],
-                    capture_output=True,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
                     check=True,
                 )
             except subprocess.CalledProcessError:
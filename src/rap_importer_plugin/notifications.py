@@ -1,20 +1,103 @@
-"""macOS notifications for RAP Importer."""
+"""macOS notifications for RAP Importer.
+
+Notifications are posted in-process through NSUserNotificationCenter (PyObjC,
+installed alongside rumps) when a notification center is available. Without
+PyObjC, or when running outside an app bundle where macOS provides no center,
+they fall back to spawning osascript.
+
+Delivery happens on a background thread: notify() only queues the request, so
+the pipeline never waits on notification delivery. Requests that pile up while
+a delivery is in progress are coalesced per title into one notification that
+lists their distinct messages.
+"""
 
 from __future__ import annotations
 
+import atexit
+import queue
 import subprocess
-from typing import TYPE_CHECKING
+import threading
+import time
+from contextlib import AbstractContextManager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable
 
 from .logging_config import get_logger
+from .paths import user_cache_dir
 
 if TYPE_CHECKING:
     from .config import NotificationsConfig
 
 logger = get_logger("notifications")
 
+
+@dataclass
+class _NativeNotifier:
+    """PyObjC objects for posting notifications, resolved once at setup."""
+
+    center: Any  # NSUserNotificationCenter
+    notification_class: Any  # NSUserNotification
+    sound_name: Any  # NSUserNotificationDefaultSoundName
+    autorelease_pool: Callable[[], AbstractContextManager[Any]]  # objc.autorelease_pool
+
+    def deliver(self, title: str, message: str, sound: bool) -> None:
+        """Post one notification.
+
+        Args:
+            title: Notification title
+            message: Notification body text
+            sound: Whether to play a sound
+        """
+        # Runs on the delivery thread, which has no autorelease pool of its
+        # own: drain the Objective-C objects created for each notification
+        with self.autorelease_pool():
+            notification = self.notification_class.alloc().init()
+            notification.setTitle_(title)
+            notification.setInformativeText_(message)
+            if sound:
+                notification.setSoundName_(self.sound_name)
+            self.center.deliverNotification_(notification)
+
+
 # Global config reference (set by setup_notifications)
 _config: NotificationsConfig | None = None
 
+# Native notifier (set by setup_notifications), None = use osascript
+_native: _NativeNotifier | None = None
+
+# Pending (title, message, sound) requests, drained by the delivery thread
+_queue: queue.Queue[tuple[str, str, bool]] = queue.Queue()
+_worker: threading.Thread | None = None
+_worker_lock = threading.Lock()
+
+# How long to wait at exit for queued notifications to be delivered
+_FLUSH_TIMEOUT_SECONDS = 5.0
+
+# Distinct messages listed in one coalesced notification before "(+N more)"
+_COALESCE_MAX_MESSAGES = 3
+
+# Notification script for the osascript fallback, compiled once at setup so
+# each notification skips AppleScript compilation. Text is passed as argv,
+# so it needs no escaping: osascript <script> <title> <message> [sound]
+_NOTIFY_SCRIPT_SOURCE = """\
+on run argv
+    set theTitle to item 1 of argv
+    set theMessage to item 2 of argv
+    if (count of argv) > 2 then
+        display notification theMessage with title theTitle sound name (item 3 of argv)
+    else
+        display notification theMessage with title theTitle
+    end if
+end run
+"""
+
+# Compiled notification script (set by setup_notifications), None = use -e
+_compiled_script: Path | None = None
+
+# Backslashes and double quotes must be escaped inside AppleScript strings
+_ESCAPE_TABLE = str.maketrans({"\\": "\\\\", '"': '\\"'})
+
 
 def setup_notifications(config: NotificationsConfig) -> None:
     """Initialize the notifications module with configuration.
@@ -22,9 +105,170 @@ def setup_notifications(config: NotificationsConfig) -> None:
     Args:
         config: Notifications configuration
     """
-    global _config
+    global _config, _native, _compiled_script
     _config = config
-    logger.debug(f"Notifications configured: enabled={config.enabled}, on_error={config.on_error}")
+    _native = _get_native_notifier() if config.enabled else None
+    if config.enabled and _native is None and _compiled_script is None:
+        _compiled_script = _compile_notify_script()
+    backend = "native" if _native is not None else "osascript"
+    logger.debug(
+        f"Notifications configured: enabled={config.enabled}, "
+        f"on_error={config.on_error}, backend={backend}"
+    )
+    if config.enabled:
+        _start_worker()
+
+
+def _start_worker() -> None:
+    """Start the notification delivery thread (once per process)."""
+    global _worker
+    with _worker_lock:
+        if _worker is not None:
+            return
+        _worker = threading.Thread(
+            target=_delivery_loop, name="rap-notifications", daemon=True
+        )
+        _worker.start()
+        atexit.register(flush_notifications)
+
+
+def _delivery_loop() -> None:
+    """Deliver queued notifications, coalescing any backlog."""
+    while True:
+        batch = [_queue.get()]
+        # Drain whatever else queued up while we were busy
+        while True:
+            try:
+                batch.append(_queue.get_nowait())
+            except queue.Empty:
+                break
+        try:
+            for title, message, sound in _coalesce(batch):
+                _deliver(title, message, sound)
+        finally:
+            for _ in batch:
+                _queue.task_done()
+
+
+def _coalesce(batch: list[tuple[str, str, bool]]) -> list[tuple[str, str, bool]]:
+    """Merge queued notifications that share a title.
+
+    Args:
+        batch: Queued (title, message, sound) requests in arrival order
+
+    Returns:
+        One request per title, in order of first arrival. Identical messages
+        are shown once; distinct ones (e.g., "Import Failed" for different
+        files) are listed one per line, up to _COALESCE_MAX_MESSAGES, with a
+        "(+N more)" line for the rest. A merged request plays a sound if any
+        of its requests asked for one.
+    """
+    merged: dict[str, tuple[dict[str, None], bool]] = {}
+    for title, message, sound in batch:
+        if title in merged:
+            messages, any_sound = merged[title]
+            messages[message] = None
+            merged[title] = (messages, any_sound or sound)
+        else:
+            merged[title] = ({message: None}, sound)
+
+    coalesced = []
+    for title, (messages, sound) in merged.items():
+        lines = list(messages)
+        extra = len(lines) - _COALESCE_MAX_MESSAGES
+        if extra > 0:
+            lines = [*lines[:_COALESCE_MAX_MESSAGES], f"(+{extra} more)"]
+        coalesced.append((title, "\n".join(lines), sound))
+    return coalesced
+
+
+def flush_notifications(timeout: float = _FLUSH_TIMEOUT_SECONDS) -> None:
+    """Wait (bounded) for queued notifications to be delivered.
+
+    Registered with atexit so run-once mode doesn't drop notifications
+    queued just before exit.
+
+    Args:
+        timeout: Maximum seconds to wait
+    """
+    deadline = time.monotonic() + timeout
+    while _queue.unfinished_tasks and time.monotonic() < deadline:
+        time.sleep(0.05)
+
+
+def _compile_notify_script() -> Path | None:
+    """Compile the osascript notification script into the user cache folder.
+
+    The compiled script is reused across runs: osacompile only runs when the
+    script source changed or notify.scpt is missing or older than it.
+
+    Returns:
+        Path to the compiled .scpt, or None if compilation failed
+    """
+    script_dir = user_cache_dir()
+    source_path = script_dir / "notify.applescript"
+    compiled_path = script_dir / "notify.scpt"
+    try:
+        script_dir.mkdir(parents=True, exist_ok=True)
+        try:
+            current_source = source_path.read_text()
+        except FileNotFoundError:
+            current_source = None
+        if current_source != _NOTIFY_SCRIPT_SOURCE:
+            source_path.write_text(_NOTIFY_SCRIPT_SOURCE)
+        elif _is_newer(compiled_path, source_path):
+            return compiled_path
+        subprocess.run(
+            ["osacompile", "-o", str(compiled_path), str(source_path)],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            check=True,
+            timeout=10,
+        )
+        return compiled_path
+    except (OSError, subprocess.SubprocessError) as e:
+        logger.debug(f"Could not compile notification script, using inline AppleScript: {e}")
+        return None
+
+
+def _is_newer(path: Path, than: Path) -> bool:
+    """Check whether path exists and was modified no earlier than another file."""
+    try:
+        return path.stat().st_mtime_ns >= than.stat().st_mtime_ns
+    except FileNotFoundError:
+        return False
+
+
+def _get_native_notifier() -> _NativeNotifier | None:
+    """Resolve the PyObjC notification objects, or None if unavailable.
+
+    Returns:
+        Notifier for the default user notification center, or None if PyObjC
+        is missing or the process has no bundle identifier (e.g., a plain
+        `uv run`)
+    """
+    try:
+        import objc
+        from Foundation import (
+            NSUserNotification,
+            NSUserNotificationCenter,
+            NSUserNotificationDefaultSoundName,
+        )
+    except ImportError:
+        return None
+    try:
+        center = NSUserNotificationCenter.defaultUserNotificationCenter()
+    except Exception as e:
+        logger.debug(f"Native notification center unavailable: {e}")
+        return None
+    if center is None:
+        return None
+    return _NativeNotifier(
+        center=center,
+        notification_class=NSUserNotification,
+        sound_name=NSUserNotificationDefaultSoundName,
+        autorelease_pool=objc.autorelease_pool,
+    )
 
 
 def notify(title: str, message: str, sound: bool = False) -> bool:
@@ -36,7 +280,7 @@ def notify(title: str, message: str, sound: bool = False) -> bool:
         sound: Whether to play a sound
 
     Returns:
-        True if notification was shown successfully
+        True if notification was queued for delivery
     """
     if _config is None:
         logger.warning(f"Cannot show notification (config not initialized): {title}")
@@ -45,15 +289,75 @@ def notify(title: str, message: str, sound: bool = False) -> bool:
         logger.debug(f"Notifications disabled, skipping: {title}")
         return False
 
+    _queue.put_nowait((title, message, sound))
+    return True
+
+
+def _deliver(title: str, message: str, sound: bool) -> bool:
+    """Show a notification using the configured backend.
+
+    Args:
+        title: Notification title
+        message: Notification body text
+        sound: Whether to play a sound
+
+    Returns:
+        True if notification was shown successfully
+    """
+    if _native is not None:
+        return _notify_native(_native, title, message, sound)
+    return _notify_osascript(title, message, sound)
+
+
+def _notify_native(native: _NativeNotifier, title: str, message: str, sound: bool) -> bool:
+    """Post a notification in-process via NSUserNotificationCenter.
+
+    Args:
+        native: Notifier resolved by setup_notifications
+        title: Notification title
+        message: Notification body text
+        sound: Whether to play a sound
+
+    Returns:
+        True if notification was delivered
+    """
+    try:
+        native.deliver(title, message, sound)
+        logger.debug(f"Notification shown: {title}")
+        return True
+    except Exception as e:
+        logger.warning(f"Unexpected notification error: {e}")
+        return False
+
+
+def _notify_osascript(title: str, message: str, sound: bool) -> bool:
+    """Show a notification by running osascript.
+
+    Args:
+        title: Notification title
+        message: Notification body text
+        sound: Whether to play a sound
+
+    Returns:
+        True if notification was shown successfully
+    """
     try:
-        # Build the AppleScript command
-        script = f'display notification "{_escape(message)}" with title "{_escape(title)}"'
-        if sound:
-            script += ' sound name "default"'
+        if _compiled_script is not None:
+            # Precompiled script takes the text as arguments
+            cmd = ["osascript", str(_compiled_script), title, message]
+            if sound:
+                cmd.append("default")
+        else:
+            # Build the AppleScript command
+            script = f'display notification "{_escape(message)}" with title "{_escape(title)}"'
+            if sound:
+                script += ' sound name "default"'
+            cmd = ["osascript", "-e", script]
 
         subprocess.run(
-            ["osascript", "-e", script],
-            capture_output=True,
+            cmd,
+            stdout=subprocess.DEVNULL,  # Only stderr is read (on failure)
+            stderr=subprocess.PIPE,
             check=True,
             timeout=5,
         )
@@ -79,7 +383,7 @@ def notify_error(title: str, message: str) -> bool:
         message: Error description
 
     Returns:
-        True if notification was shown
+        True if notification was queued
     """
     if _config is None:
         logger.warning(f"Cannot show error notification (config not initialized): {title}")
@@ -98,7 +402,7 @@ def notify_success(title: str, message: str) -> bool:
         message: Success description
 
     Returns:
-        True if notification was shown
+        True if notification was queued
     """
     if _config is None or not _config.on_success:
         return False
@@ -114,5 +418,5 @@ def _escape(text: str) -> str:
     Returns:
         Escaped text safe for AppleScript
     """
-    # Escape backslashes first, then quotes
-    return text.replace("\\", "\\\\").replace('"', '\\"')
+    # Single pass, so escaped backslashes are never re-escaped
+    return text.translate(_ESCAPE_TABLE)
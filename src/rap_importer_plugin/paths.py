@@ -9,13 +9,47 @@ The expand_path function chains os.path.expandvars() and os.path.expanduser()
 to handle all cases. If an environment variable is not set, expandvars()
 silently leaves it unchanged (e.g., "${UNDEFINED}" stays as-is), which allows
 path validation to catch the issue with a clear error message.
+
+Paths containing neither $ nor ~ (most script arguments) are returned as-is.
+Other results are memoized. The cache key includes the current values of the
+environment variables a path references (plus HOME), so changing the
+environment (e.g., loading .env) never returns a stale expansion.
 """
 
 from __future__ import annotations
 
 import os
+import re
+from functools import lru_cache
 from pathlib import Path
 
+# Same variable syntax os.path.expandvars() recognizes on POSIX
+_VAR_RE = re.compile(r"\$(\w+|\{[^}]*\})", re.ASCII)
+
+
+@lru_cache(maxsize=256)
+def _env_dependencies(path: str) -> tuple[str, ...]:
+    """Return the environment variable names an expansion of path depends on."""
+    names = [m.group(1).strip("{}") for m in _VAR_RE.finditer(path)]
+    # HOME drives ~ expansion, including a ~ introduced by a variable's value
+    names.append("HOME")
+    return tuple(names)
+
+
+@lru_cache(maxsize=256)
+def _expand_path_cached(path: str, _env_values: tuple[str | None, ...]) -> str:
+    """Expand path; _env_values only keys the cache on the relevant environment."""
+    # First expand ${VAR} and $VAR
+    expanded = os.path.expandvars(path)
+    # Then expand ~ to home directory
+    expanded = os.path.expanduser(expanded)
+    return expanded
+
+
+def _env_values(path: str) -> tuple[str | None, ...]:
+    """Return the current values of the environment variables path depends on."""
+    return tuple(os.environ.get(name) for name in _env_dependencies(path))
+
 
 def expand_path(path: str) -> str:
     """Expand environment variables and ~ in a path string.
@@ -31,11 +65,10 @@ def expand_path(path: str) -> str:
         >>> expand_path("~/documents")        # Expands ~
         >>> expand_path("${RAP_BASE}/import") # Expands RAP_BASE if set
     """
-    # First expand ${VAR} and $VAR
-    expanded = os.path.expandvars(path)
-    # Then expand ~ to home directory
-    expanded = os.path.expanduser(expanded)
-    return expanded
+    # Nothing to expand: skip the environment lookups the cache key needs
+    if "$" not in path and "~" not in path:
+        return path
+    return _expand_path_cached(path, _env_values(path))
 
 
 def expand_path_to_path(path: str) -> Path:
@@ -48,3 +81,16 @@ def expand_path_to_path(path: str) -> Path:
         Expanded Path object
     """
     return Path(expand_path(path))
+
+
+def user_cache_dir() -> Path:
+    """Get the folder for RAP Importer's cache files.
+
+    Uses $XDG_CACHE_HOME when set, otherwise ~/Library/Caches. Read on every
+    call, so tests (and .env files) can redirect it.
+
+    Returns:
+        The rap-importer folder inside the user cache folder (not created)
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / "Library" / "Caches")
+    return Path(cache_home) / "rap-importer"
@@ -0,0 +1,58 @@
+"""Glob pattern compilation for RAP Importer.
+
+Path filters (script include/exclude paths, global exclude paths) use fnmatch
+glob syntax. fnmatch.fnmatch() normalizes and looks up the translated regex on
+every call; compile_union() translates and compiles a pattern list once so the
+per-file filter checks can call ``regex.match()`` directly.
+
+A list of patterns compiles to a single alternation, so checking a path
+against the whole list is one regex call. Each alternative is a named group,
+which lets callers recover which pattern matched for logging.
+
+Matching is case-sensitive, the same as fnmatch.fnmatch() on POSIX, unless
+re.IGNORECASE is passed (as the watcher does for filename patterns).
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import re
+from collections.abc import Iterable
+from functools import lru_cache
+
+
+def compile_union(patterns: Iterable[str], flags: int = 0) -> re.Pattern[str] | None:
+    """Compile a list of fnmatch patterns into one alternation regex.
+
+    Args:
+        patterns: fnmatch glob patterns
+        flags: Regex flags (e.g., re.IGNORECASE)
+
+    Returns:
+        Compiled regex matching any of the patterns, or None if there are none
+    """
+    return _compile_union(tuple(patterns), flags)
+
+
+@lru_cache(maxsize=None)
+def _compile_union(patterns: tuple[str, ...], flags: int) -> re.Pattern[str] | None:
+    if not patterns:
+        return None
+    # fnmatch.translate() emits no capturing groups, so the named group of
+    # each alternative is the only group that can match
+    return re.compile(
+        "|".join(f"(?P<p{i}>{fnmatch.translate(p)})" for i, p in enumerate(patterns)),
+        flags,
+    )
+
+
+def matched_index(match: re.Match[str]) -> int:
+    """Get the index of the pattern that produced a compile_union() match.
+
+    Args:
+        match: Successful match from a compile_union() regex
+
+    Returns:
+        Index into the pattern list passed to compile_union()
+    """
+    return int(match.lastgroup[1:])  # type: ignore[index]
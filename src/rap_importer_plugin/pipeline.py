@@ -2,22 +2,34 @@
 
 from __future__ import annotations
 
-import fnmatch
+import errno
+import os
+import re
 import shutil
 import threading
 import time
+from collections import Counter, deque
 from pathlib import Path
 from typing import TYPE_CHECKING, Callable
 
 from .executor import FileVariables, ManualVariables, ScriptExecutor
 from .logging_config import get_logger
 from .notifications import notify_error, notify_success
+from .patterns import compile_union, matched_index
 
 if TYPE_CHECKING:
     from .config import PipelineConfig, ScriptConfig, WatchConfig
 
 logger = get_logger("pipeline")
 
+# Always-on global exclude for the archive folder, and the literal prefix it
+# matches (fnmatch "_Archived/*" is exactly startswith("_Archived/"))
+_ARCHIVED_PATTERN = "_Archived/*"
+_ARCHIVED_PREFIX = "_Archived/"
+
+# TIMING lines that scripts (e.g., AppleScript) write to stderr
+_TIMING_RE = re.compile(r"^TIMING:[^\r\n]*", re.MULTILINE)
+
 
 class PipelineManager:
     """Manages execution of script pipeline for each file."""
@@ -51,28 +63,84 @@ class PipelineManager:
         self.archive = archive
 
         # Set up global exclude paths, always including _Archived folder
-        self.global_exclude_paths = list(global_exclude_paths or [])
-        if "_Archived/*" not in self.global_exclude_paths:
-            self.global_exclude_paths.append("_Archived/*")
+        # (dict.fromkeys drops duplicates in one pass, keeping first positions)
+        self.global_exclude_paths = list(
+            dict.fromkeys([*(global_exclude_paths or []), _ARCHIVED_PATTERN])
+        )
+
+        # Expanded once; every file path is resolved against this folder
+        self._base_folder = watch_config.expanded_base_folder
+        # Base folder with a trailing separator, for string prefix checks
+        self._base_prefix = os.path.join(str(self._base_folder), "")
+
+        # Archive folders already created, so mkdir runs once per folder
+        self._archive_dirs_created: set[Path] = set()
 
         # Track failed files and their retry counts
-        self._failed_files: dict[str, int] = {}
-        self._files_processed = 0
+        self._failed_files: Counter[str] = Counter()
+        # Success counts sharded per thread ident so concurrent workers never
+        # contend on one counter; files_processed sums the shards on read.
+        # Idents are unique among live threads and recycled afterwards, so
+        # the shard map stays bounded even with a thread per file.
+        self._processed_shards: dict[int, list[int]] = {}
+        self._shard_lock = threading.Lock()  # Only taken to add a new shard
+
+        # Track actively processing files: one entry per in-flight run.
+        # deque.append/pop are atomic, so no lock is needed to count.
+        self._active: deque[None] = deque()
 
-        # Track actively processing files (thread-safe)
-        self._active_processing = 0
-        self._active_lock = threading.Lock()
+    @property
+    def global_exclude_paths(self) -> list[str]:
+        """Patterns excluded from all processing (includes _Archived/*)."""
+        return self._global_exclude_paths
+
+    @global_exclude_paths.setter
+    def global_exclude_paths(self, patterns: list[str]) -> None:
+        self._global_exclude_paths = patterns
+        self._compiled_global_exclude = compile_union(patterns)
+        # Archived files are the most common exclusion (every archive move
+        # produces an event), so that pattern gets a startswith fast path
+        self._excludes_archived = _ARCHIVED_PATTERN in patterns
 
     @property
     def files_processed(self) -> int:
         """Number of files successfully processed."""
-        return self._files_processed
+        return sum(shard[0] for shard in list(self._processed_shards.values()))
+
+    @property
+    def failed_count(self) -> int:
+        """Number of files currently tracked as failed."""
+        return len(self._failed_files)
 
     @property
     def active_processing(self) -> int:
         """Number of files currently being processed (thread-safe)."""
-        with self._active_lock:
-            return self._active_processing
+        return len(self._active)
+
+    def _increment_processed(self) -> None:
+        """Count one successful run on the calling thread's shard."""
+        ident = threading.get_ident()
+        shard = self._processed_shards.get(ident)
+        if shard is None:
+            with self._shard_lock:
+                shard = self._processed_shards.setdefault(ident, [0])
+        shard[0] += 1
+
+    def _relative_to_base(self, path: str) -> str | None:
+        """Get a path relative to the base folder.
+
+        A string prefix check, so files outside the base folder don't cost a
+        raised ValueError as with Path.relative_to().
+
+        Args:
+            path: Absolute file path
+
+        Returns:
+            Path relative to base folder, or None if the file is outside it
+        """
+        if path.startswith(self._base_prefix):
+            return path[len(self._base_prefix):]
+        return None
 
     def _should_run_script(self, script: ScriptConfig, relative_path: str) -> bool:
         """Check if script should run based on path filters.
@@ -90,28 +158,31 @@ class PipelineManager:
             True if script should run for this file
         """
         # No filters = run on all files (backward compatible)
-        if not script.include_paths and not script.exclude_paths:
+        if not script.has_path_filters:
             return True
 
         # Check exclude patterns first (exclude takes precedence)
-        for pattern in script.exclude_paths:
-            if fnmatch.fnmatch(relative_path, pattern):
+        if script.compiled_exclude_paths is not None:
+            match = script.compiled_exclude_paths.match(relative_path)
+            if match:
+                pattern = script.exclude_paths[matched_index(match)]
                 logger.debug(
                     f"Script '{script.name}' excluded by pattern '{pattern}': {relative_path}"
                 )
                 return False
 
         # If no include patterns, run on all non-excluded files
-        if not script.include_paths:
+        if script.compiled_include_paths is None:
             return True
 
         # Check include patterns - must match at least one
-        for pattern in script.include_paths:
-            if fnmatch.fnmatch(relative_path, pattern):
-                logger.debug(
-                    f"Script '{script.name}' included by pattern '{pattern}': {relative_path}"
-                )
-                return True
+        match = script.compiled_include_paths.match(relative_path)
+        if match:
+            pattern = script.include_paths[matched_index(match)]
+            logger.debug(
+                f"Script '{script.name}' included by pattern '{pattern}': {relative_path}"
+            )
+            return True
 
         # Didn't match any include pattern
         logger.debug(
@@ -128,13 +199,17 @@ class PipelineManager:
         Returns:
             True if file should be excluded globally
         """
-        for pattern in self.global_exclude_paths:
-            if fnmatch.fnmatch(relative_path, pattern):
-                logger.debug(
-                    f"File excluded by global pattern '{pattern}': {relative_path}"
-                )
-                return True
-        return False
+        if self._excludes_archived and relative_path.startswith(_ARCHIVED_PREFIX):
+            logger.debug(f"File excluded by global pattern '{_ARCHIVED_PATTERN}': {relative_path}")
+            return True
+        if self._compiled_global_exclude is None:
+            return False
+        match = self._compiled_global_exclude.match(relative_path)
+        if match is None:
+            return False
+        pattern = self.global_exclude_paths[matched_index(match)]
+        logger.debug(f"File excluded by global pattern '{pattern}': {relative_path}")
+        return True
 
     def process_file(self, file_path: Path) -> bool:
         """Run all scripts in pipeline for a file.
@@ -152,34 +227,39 @@ class PipelineManager:
             logger.debug(f"Skipping file (max retries exceeded): {file_path}")
             return False
 
-        # Check if file exists
-        if not file_path.exists():
+        # Check if file exists (os.stat directly, without Path.exists() wrapping)
+        try:
+            os.stat(file_path)
+        except OSError:
             logger.warning(f"File no longer exists: {file_path}")
             return False
 
-        # Compute relative path for filtering checks
-        base_folder = self.watch_config.expanded_base_folder
-        try:
-            relative_path = str(file_path.relative_to(base_folder))
-        except ValueError:
-            relative_path = file_path.name
+        # Compute relative path for filtering checks (reused for archiving)
+        base_folder = self._base_folder
+        relative = self._relative_to_base(file_key)
+        relative_path = relative if relative is not None else file_path.name
 
         # Check global exclude patterns (before any processing)
         if self._is_globally_excluded(relative_path):
             return False  # Silent skip, already logged at DEBUG
 
         # Track active processing (for menu bar indicator)
-        with self._active_lock:
-            self._active_processing += 1
+        self._active.append(None)
 
         try:
-            return self._do_process_file(file_path, base_folder, relative_path, file_key)
+            return self._do_process_file(
+                file_path, base_folder, relative_path, file_key, relative
+            )
         finally:
-            with self._active_lock:
-                self._active_processing -= 1
+            self._active.pop()
 
     def _do_process_file(
-        self, file_path: Path, base_folder: Path, relative_path: str, file_key: str
+        self,
+        file_path: Path,
+        base_folder: Path,
+        relative_path: str,
+        file_key: str,
+        relative: str | None = None,
     ) -> bool:
         """Internal method that performs the actual file processing.
 
@@ -188,6 +268,7 @@ class PipelineManager:
             base_folder: Watch folder base path
             relative_path: Path relative to watch folder
             file_key: String key for tracking failures
+            relative: Path relative to base folder, or None if file is outside it
 
         Returns:
             True if all scripts succeeded, False otherwise
@@ -195,25 +276,27 @@ class PipelineManager:
         pipeline_start = time.time()
         logger.info(f"Processing: {file_path.name}")
 
-        # Create variables for substitution
-        variables = FileVariables.from_file(file_path, base_folder, self.log_level)
-
-        logger.debug(
-            f"Variables: database={variables.database}, "
-            f"group_path={variables.group_path}, filename={variables.filename}"
-        )
-
-        # Filter scripts by enabled status and path filters
+        # Filter scripts by enabled status and path filters. Files outside the
+        # base folder are matched on their full path, as FileVariables does.
+        filter_path = relative_path if relative is not None else file_key
         scripts = [
             s for s in self.config.enabled_scripts
-            if self._should_run_script(s, variables.relative_path)
+            if self._should_run_script(s, filter_path)
         ]
 
         if not scripts:
             # No scripts matched - leave file in place for manual review
-            logger.info(f"No scripts matched path filters: {variables.relative_path}")
+            logger.info(f"No scripts matched path filters: {filter_path}")
             return False
 
+        # Create variables for substitution (only needed once a script will run)
+        variables = FileVariables.from_file(file_path, base_folder, self.log_level)
+
+        logger.debug(
+            f"Variables: database={variables.database}, "
+            f"group_path={variables.group_path}, filename={variables.filename}"
+        )
+
         for i, script in enumerate(scripts, 1):
             logger.debug(f"Running script {i}/{len(scripts)}: {script.name}")
 
@@ -224,10 +307,9 @@ class PipelineManager:
             logger.info(f"  [{script.name}] completed in {duration_sec:.2f}s")
 
             # Log any TIMING output from AppleScript (captured in stderr)
-            if result.stderr and "TIMING:" in result.stderr:
-                for line in result.stderr.splitlines():
-                    if line.startswith("TIMING:"):
-                        logger.info(f"  [{script.name}] {line}")
+            if result.stderr:
+                for match in _TIMING_RE.finditer(result.stderr):
+                    logger.info(f"  [{script.name}] {match.group()}")
 
             if not result.success:
                 logger.error(
@@ -264,13 +346,13 @@ class PipelineManager:
 
         # Archive the original file (if enabled)
         if self.archive:
-            self._archive_file(file_path)
+            self._archive_file(file_path, relative)
 
         # Clear any failure tracking
         self._failed_files.pop(file_key, None)
 
         # Update counter and notify
-        self._files_processed += 1
+        self._increment_processed()
 
         if self.on_success:
             self.on_success()
@@ -291,8 +373,8 @@ class PipelineManager:
         Returns:
             True if file should be skipped
         """
-        failure_count = self._failed_files.get(file_key, 0)
-        return failure_count >= self.config.retry_count
+        # Counter lookups of unknown keys return 0 without inserting
+        return self._failed_files[file_key] >= self.config.retry_count
 
     def _record_failure(self, file_key: str) -> None:
         """Record a failure for a file.
@@ -300,8 +382,7 @@ class PipelineManager:
         Args:
             file_key: File path as string
         """
-        current = self._failed_files.get(file_key, 0)
-        self._failed_files[file_key] = current + 1
+        self._failed_files[file_key] += 1
 
         remaining = self.config.retry_count - self._failed_files[file_key]
         if remaining > 0:
@@ -313,33 +394,63 @@ class PipelineManager:
                 f"Max retries exceeded for file. Check logs for details.",
             )
 
-    def _archive_file(self, file_path: Path) -> None:
+    def _archive_file(self, file_path: Path, relative: str | None = None) -> None:
         """Archive file to _Archived folder after successful processing.
 
         Args:
             file_path: Path to the file to archive
+            relative: Path relative to base folder, if already computed
         """
-        base_folder = self.watch_config.expanded_base_folder
+        base_folder = self._base_folder
+
+        if relative is None:
+            relative = self._relative_to_base(str(file_path))
+        if relative is None:
+            # File not under base_folder - shouldn't happen but handle gracefully
+            logger.warning(f"Cannot archive file outside base folder: {file_path}")
+            return
 
         try:
             # Calculate archive path preserving folder structure
-            relative = file_path.relative_to(base_folder)
-            archive_dir = base_folder / "_Archived" / relative.parent
-            archive_dir.mkdir(parents=True, exist_ok=True)
+            archive_dir = base_folder / "_Archived" / os.path.dirname(relative)
+            if archive_dir not in self._archive_dirs_created:
+                archive_dir.mkdir(parents=True, exist_ok=True)
+                self._archive_dirs_created.add(archive_dir)
 
             # Handle name collisions
             dest_path = self._get_unique_archive_path(archive_dir, file_path.name)
 
-            # Move file to archive
-            shutil.move(str(file_path), str(dest_path))
+            try:
+                self._move_file(file_path, dest_path)
+            except FileNotFoundError:
+                if not file_path.exists():
+                    raise
+                # Archive folder was removed since we created it
+                archive_dir.mkdir(parents=True, exist_ok=True)
+                self._move_file(file_path, dest_path)
             logger.debug(f"Archived: {file_path} -> {dest_path}")
 
-        except ValueError:
-            # File not under base_folder - shouldn't happen but handle gracefully
-            logger.warning(f"Cannot archive file outside base folder: {file_path}")
         except OSError as e:
             logger.warning(f"Failed to archive file: {e}")
 
+    @staticmethod
+    def _move_file(file_path: Path, dest_path: Path) -> None:
+        """Move a file, renaming in place when possible.
+
+        The archive lives under base_folder, so this is normally a single
+        rename; files are only copied when the rename crosses filesystems.
+
+        Args:
+            file_path: File to move
+            dest_path: Destination path
+        """
+        try:
+            os.replace(file_path, dest_path)
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+            shutil.move(str(file_path), str(dest_path))
+
     def _get_unique_archive_path(self, archive_dir: Path, filename: str) -> Path:
         """Get unique path in archive, appending suffix if needed.
 
@@ -361,11 +472,14 @@ class PipelineManager:
         stem = dest.stem
         suffix = dest.suffix
 
+        # One directory listing instead of an exists() probe per suffix.
+        # Compare casefolded names: the default macOS filesystem is
+        # case-insensitive, so "Doc-000.pdf" would collide with "doc-000.pdf".
+        taken = {name.casefold() for name in os.listdir(archive_dir)}
         for i in range(1000):
             new_name = f"{stem}-{i:03d}{suffix}"
-            dest = archive_dir / new_name
-            if not dest.exists():
-                return dest
+            if new_name.casefold() not in taken:
+                return archive_dir / new_name
 
         raise RuntimeError(f"Archive suffix exhausted for {filename} (max -999)")
 
@@ -433,14 +547,12 @@ class PipelineManager:
         logger.debug(f"Manual variables: base_folder={variables.base_folder}")
 
         # Track active processing (for menu bar indicator)
-        with self._active_lock:
-            self._active_processing += 1
+        self._active.append(None)
 
         try:
             return self._do_run_manual(variables, run_start)
         finally:
-            with self._active_lock:
-                self._active_processing -= 1
+            self._active.pop()
 
     def _do_run_manual(self, variables: ManualVariables, run_start: float) -> bool:
         """Internal method that performs the manual pipeline run.
@@ -469,10 +581,9 @@ class PipelineManager:
             logger.info(f"  [{script.name}] completed in {duration_sec:.2f}s")
 
             # Log any TIMING output (captured in stderr)
-            if result.stderr and "TIMING:" in result.stderr:
-                for line in result.stderr.splitlines():
-                    if line.startswith("TIMING:"):
-                        logger.info(f"  [{script.name}] {line}")
+            if result.stderr:
+                for match in _TIMING_RE.finditer(result.stderr):
+                    logger.info(f"  [{script.name}] {match.group()}")
 
             if not result.success:
                 logger.error(f"Script '{script.name}' failed: {result.error}")
@@ -496,7 +607,7 @@ class PipelineManager:
         logger.info(f"Manual pipeline complete (total: {run_elapsed:.2f}s)")
 
         # Increment counter for display
-        self._files_processed += 1
+        self._increment_processed()
 
         if self.on_success:
             self.on_success()
@@ -7,19 +7,26 @@ include/exclude filtering results.
 
 from __future__ import annotations
 
-import fnmatch
+import itertools
 import re
 from dataclasses import dataclass
 from enum import Enum
 from typing import TYPE_CHECKING
 
-from rich.console import Console
+from rich.console import Console, Group
 from rich.panel import Panel
 from rich.table import Table
 
+from .patterns import compile_union
+
 if TYPE_CHECKING:
+    from rich.console import RenderableType
+
     from .config import Config, ScriptConfig, WatcherConfig
 
+# Middle wildcard component, e.g. the "/*/" in "Database/*/SubFolder"
+_MID_WILDCARD_RE = re.compile(r"/\*/")
+
 
 class FilterResult(Enum):
     """Result of path filter evaluation."""
@@ -63,7 +70,7 @@ def _pattern_to_example(pattern: str, default_database: str = "SampleDB") -> str
 
     # Handle middle wildcards (replace with sample folder)
     # Match patterns like "Database/*/SubFolder" -> "Database/Sample/SubFolder"
-    path = re.sub(r'/\*/', '/Sample/', path)
+    path = _MID_WILDCARD_RE.sub("/Sample/", path)
 
     # If no file extension, add test.pdf
     if not path.endswith(".pdf"):
@@ -110,21 +117,20 @@ def generate_test_paths(watcher: WatcherConfig) -> list[str]:
     Returns:
         List of example paths sorted alphabetically
     """
-    paths: set[str] = set()
-
     # Try to extract a real database name from patterns
     default_db = _extract_database_from_patterns(watcher) or "SampleDB"
 
-    # From global excludes (show what gets blocked)
-    for pattern in watcher.global_exclude_paths:
-        paths.add(_pattern_to_example(pattern, default_db))
-
-    # From each script's include/exclude patterns
-    for script in watcher.pipeline.scripts:
-        for pattern in script.include_paths:
-            paths.add(_pattern_to_example(pattern, default_db))
-        for pattern in script.exclude_paths:
-            paths.add(_pattern_to_example(pattern, default_db))
+    # From global excludes (show what gets blocked) and each script's
+    # include/exclude patterns
+    patterns = itertools.chain(
+        watcher.global_exclude_paths,
+        *(
+            itertools.chain(script.include_paths, script.exclude_paths)
+            for script in watcher.pipeline.scripts
+        ),
+    )
+    # Many scripts share patterns, so convert each distinct pattern once
+    paths = {_pattern_to_example(pattern, default_db) for pattern in set(patterns)}
 
     # Add standard test case (path that doesn't match any patterns)
     paths.add("Other Database/test.pdf")
@@ -149,22 +155,21 @@ def _check_script_filters(script: ScriptConfig, path: str) -> FilterResult:
         FilterResult indicating whether script runs or why it's skipped
     """
     # No filters = run on all files
-    if not script.include_paths and not script.exclude_paths:
+    if not script.has_path_filters:
         return FilterResult.RUN
 
     # Check exclude patterns first (exclude takes precedence)
-    for pattern in script.exclude_paths:
-        if fnmatch.fnmatch(path, pattern):
-            return FilterResult.EXCLUDED
+    exclude = script.compiled_exclude_paths
+    if exclude is not None and exclude.match(path):
+        return FilterResult.EXCLUDED
 
     # If no include patterns, run on all non-excluded files
-    if not script.include_paths:
+    if script.compiled_include_paths is None:
         return FilterResult.RUN
 
     # Check include patterns - must match at least one
-    for pattern in script.include_paths:
-        if fnmatch.fnmatch(path, pattern):
-            return FilterResult.RUN
+    if script.compiled_include_paths.match(path):
+        return FilterResult.RUN
 
     # Didn't match any include pattern
     return FilterResult.SKIPPED
@@ -181,13 +186,13 @@ def evaluate_path(path: str, watcher: WatcherConfig) -> PathEvaluation:
         PathEvaluation with global status and per-script results
     """
     # Check global exclude first
-    for pattern in watcher.global_exclude_paths:
-        if fnmatch.fnmatch(path, pattern):
-            return PathEvaluation(
-                path=path,
-                globally_excluded=True,
-                script_results={},
-            )
+    global_exclude = compile_union(watcher.global_exclude_paths)
+    if global_exclude is not None and global_exclude.match(path):
+        return PathEvaluation(
+            path=path,
+            globally_excluded=True,
+            script_results={},
+        )
 
     # Check each enabled script
     script_results: dict[str, FilterResult] = {}
@@ -235,6 +240,7 @@ def run_simulation(config: Config, custom_paths: tuple[str, ...]) -> int:
         Exit code (0 for success)
     """
     console = Console()
+    renderables: list[RenderableType] = []
 
     for watcher in config.enabled_watchers:
         # Generate test paths
@@ -248,7 +254,7 @@ def run_simulation(config: Config, custom_paths: tuple[str, ...]) -> int:
 
         # Display watcher info
         global_excludes = ", ".join(watcher.global_exclude_paths) or "(none)"
-        console.print(Panel(
+        renderables.append(Panel(
             f"[bold]Watcher:[/bold] {watcher.name}\n"
             f"[bold]Global Excludes:[/bold] {global_excludes}",
             expand=False,
@@ -286,16 +292,19 @@ def run_simulation(config: Config, custom_paths: tuple[str, ...]) -> int:
 
             table.add_row(*row)
 
-        console.print(table)
-        console.print()
+        renderables.append(table)
+        renderables.append("")
 
         # Legend
-        console.print(
+        renderables.append(
             "[dim]Legend: [green]✓ RUN[/green] = script executes, "
             "[red]✗ excl[/red] = excluded by pattern, "
             "[yellow]✗ skip[/yellow] = no include match, "
             "[dim]-[/dim] = globally excluded[/dim]"
         )
-        console.print()
+        renderables.append("")
+
+    # Render everything in one print call
+    console.print(Group(*renderables))
 
     return 0
@@ -2,17 +2,27 @@
 
 from __future__ import annotations
 
-import fnmatch
+import heapq
+import operator
 import os
+import re
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import TYPE_CHECKING, Callable
-
-from watchdog.events import FileCreatedEvent, FileModifiedEvent, FileSystemEventHandler
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator
+
+from watchdog.events import (
+    FileClosedEvent,
+    FileCreatedEvent,
+    FileModifiedEvent,
+    FileSystemEvent,
+    FileSystemEventHandler,
+)
 from watchdog.observers import Observer
 
 from .logging_config import get_logger
+from .patterns import compile_union, matched_index
 
 if TYPE_CHECKING:
     from .config import WatchConfig
@@ -20,12 +30,83 @@ if TYPE_CHECKING:
 logger = get_logger("watcher")
 
 
+# Maximum number of stable files handed to on_file_ready at the same time
+_READY_WORKERS = 4
+
+# scan_existing_files walks top-level subfolders in parallel when there are at
+# least this many (os.scandir and stat release the GIL)
+_PARALLEL_SCAN_MIN_FOLDERS = 16
+_SCAN_WORKERS = 8
+
+# Patterns of the form "*.ext" or "*.ext1.ext2" (no other wildcards), which
+# match on the file's literal suffix alone
+_SUFFIX_PATTERN_RE = re.compile(r"\*\.([^*?\[]+)")
+
+
+class _FilenamePatterns:
+    """Case-insensitive filename patterns (e.g., *.pdf matches .PDF).
+
+    Most configured patterns are plain "*.ext" globs (including multi-part
+    ones like "*.pdf.download"), so those are matched by dict lookups on the
+    filename's lowercased suffixes: one per dot, however many patterns there
+    are. Any other patterns are fused into one IGNORECASE regex.
+    """
+
+    def __init__(self, patterns: list[str]) -> None:
+        """Split patterns into extension lookups and a regex.
+
+        Args:
+            patterns: fnmatch patterns
+        """
+        self._suffixes: dict[str, str] = {}  # lowercased suffix -> pattern
+        self._others: list[str] = []
+        for pattern in patterns:
+            match = _SUFFIX_PATTERN_RE.fullmatch(pattern)
+            if match:
+                self._suffixes.setdefault(match.group(1).lower(), pattern)
+            else:
+                self._others.append(pattern)
+        # Number of trailing dot-separated parts worth looking up
+        self._suffix_parts = max((s.count(".") + 1 for s in self._suffixes), default=0)
+        self._regex = compile_union(self._others, re.IGNORECASE)
+
+    def match(self, filename: str) -> str | None:
+        """Find the pattern a filename matches.
+
+        Args:
+            filename: File name without directory
+
+        Returns:
+            The first matching pattern, or None if none match
+        """
+        # Look up "pdf", then "download.pdf" style suffixes, right to left
+        end = len(filename)
+        for _ in range(self._suffix_parts):
+            end = filename.rfind(".", 0, end)
+            if end == -1:
+                break
+            pattern = self._suffixes.get(filename[end + 1:].lower())
+            if pattern is not None:
+                return pattern
+        if self._regex is not None:
+            match = self._regex.match(filename)
+            if match:
+                return self._others[matched_index(match)]
+        return None
+
+
 class StabilityCheckHandler(FileSystemEventHandler):
     """Watches for file creation and waits for stability before callback.
 
     A file is considered "stable" when its size hasn't changed for a
     configured duration. This handles files that are still being written
     (e.g., downloads in progress).
+
+    Pending files are polled by a single scheduler thread, driven by a heap
+    of (next_check, path, last_size, start_time) entries, rather than a
+    sleeping thread per file. Stable files are handed to on_file_ready on a
+    small thread pool, so a long import doesn't delay checks on other files
+    and a burst of files can't start an unbounded number of threads.
     """
 
     def __init__(
@@ -42,49 +123,120 @@ class StabilityCheckHandler(FileSystemEventHandler):
         super().__init__()
         self.config = config
         self.on_file_ready = on_file_ready
-        self._pending: dict[str, threading.Thread] = {}
+        self._pending: set[str] = set()
         self._lock = threading.Lock()
+        # Signalled when a new check is scheduled; shares _lock with _pending
+        self._cv = threading.Condition(self._lock)
+        self._checks: list[tuple[float, str, int, float]] = []  # heapq
+        self._worker: threading.Thread | None = None
+        self._stop_event = threading.Event()  # Set by shutdown() to stop _worker
+        self._executor: ThreadPoolExecutor | None = None  # Created on first use
+        # Last on_modified time per pending path, to debounce write storms
+        self._last_event: dict[str, float] = {}
+        # Pending paths whose writer closed them (inotify only), see on_closed
+        self._closed: set[str] = set()
+        self._debounce = config.stability_check_seconds / 2
+        self._check_interval = config.stability_check_seconds
+        self._timeout = config.stability_timeout_seconds
+        self._ignore = _FilenamePatterns(config.ignore_patterns)
+        self._include = _FilenamePatterns(config.file_patterns)
+
+    def dispatch(self, event: FileSystemEvent) -> None:
+        """Drop directory events and non-matching files before dispatching.
+
+        Filtering on the raw src_path string here means ignored events never
+        reach the handlers below, allocate a Path, or take the lock. Debug
+        logging on this path uses %-style arguments, so messages are only
+        formatted when DEBUG is enabled.
 
-    def on_created(self, event: FileCreatedEvent) -> None:
-        """Handle file creation events."""
+        Args:
+            event: Event from the watchdog observer
+        """
         if event.is_directory:
             return
-        self._handle_file(Path(event.src_path))
+        if not self._matches_filename(os.path.basename(event.src_path)):
+            return
+        super().dispatch(event)
+
+    def on_created(self, event: FileCreatedEvent) -> None:
+        """Handle file creation events."""
+        self._handle_file(event.src_path)
 
     def on_modified(self, event: FileModifiedEvent) -> None:
         """Handle file modification events."""
-        if event.is_directory:
+        src_path = event.src_path
+        now = time.monotonic()
+
+        # A file being written fires many events; skip those arriving within
+        # the debounce window without taking the lock (dict.get is atomic)
+        last = self._last_event.get(src_path)
+        if last is not None and now - last < self._debounce:
             return
+
         # Only process if not already pending
         with self._lock:
-            if event.src_path in self._pending:
+            self._last_event[src_path] = now
+            if src_path in self._pending:
                 return
-        self._handle_file(Path(event.src_path))
+        self._handle_file(src_path)
+
+    def on_closed(self, event: FileClosedEvent) -> None:
+        """Handle file closed-after-writing events.
+
+        Only inotify (Linux) reports these; FSEvents on macOS doesn't, so there
+        files are always polled. A closed file needs no repeated size reading:
+        its next stability check hands it off as soon as it is non-empty.
+        """
+        file_key = event.src_path
+        with self._cv:
+            self._closed.add(file_key)
+            if file_key not in self._pending:
+                self._schedule(file_key)
 
-    def _handle_file(self, file_path: Path) -> None:
+    def _handle_file(self, file_key: str) -> None:
         """Start stability check for a file.
 
+        Paths stay plain strings until a file is handed to on_file_ready.
+
         Args:
-            file_path: Path to the file
+            file_key: Path to the file (already matched by dispatch)
         """
-        # Check if file matches patterns
-        if not self._matches_patterns(file_path):
+        # Skip if already pending. The unlocked membership test is atomic and
+        # settles repeat events without the lock; the locked one decides races.
+        if file_key in self._pending:
+            logger.debug("File already pending: %s", file_key)
             return
-
-        # Skip if already pending
-        with self._lock:
-            if str(file_path) in self._pending:
-                logger.debug(f"File already pending: {file_path}")
+        with self._cv:
+            if file_key in self._pending:
+                logger.debug("File already pending: %s", file_key)
                 return
 
-            # Start stability check in background thread
-            thread = threading.Thread(
-                target=self._check_stability,
-                args=(file_path,),
+            self._schedule(file_key)
+
+    def _schedule(self, file_key: str) -> None:
+        """Mark a file pending and run its first stability check immediately.
+
+        Must be called with the lock held.
+
+        Args:
+            file_key: Path to the file
+        """
+        logger.debug("Checking stability: %s", file_key)
+        self._pending.add(file_key)
+        now = time.monotonic()
+        heapq.heappush(self._checks, (now, file_key, -1, now))
+        if self._worker is None:
+            # Each worker gets its own stop event, so a restart after
+            # shutdown() can't revive a worker that is still exiting
+            self._stop_event = threading.Event()
+            self._worker = threading.Thread(
+                target=self._run_checks,
+                args=(self._stop_event,),
+                name="rap-stability",
                 daemon=True,
             )
-            self._pending[str(file_path)] = thread
-            thread.start()
+            self._worker.start()
+        self._cv.notify()
 
     def _matches_patterns(self, file_path: Path) -> bool:
         """Check if file matches include patterns and not ignore patterns.
@@ -97,77 +249,149 @@ class StabilityCheckHandler(FileSystemEventHandler):
         Returns:
             True if file should be processed
         """
-        filename = file_path.name
-        filename_lower = filename.lower()
+        return self._matches_filename(file_path.name)
+
+    def _matches_filename(self, filename: str) -> bool:
+        """Check a filename against the include and ignore patterns.
 
+        Args:
+            filename: File name without directory
+
+        Returns:
+            True if file should be processed
+        """
         # Check ignore patterns first (case-insensitive)
-        for pattern in self.config.ignore_patterns:
-            if fnmatch.fnmatch(filename_lower, pattern.lower()):
-                logger.debug(f"File ignored by pattern '{pattern}': {filename}")
-                return False
+        pattern = self._ignore.match(filename)
+        if pattern is not None:
+            logger.debug("File ignored by pattern '%s': %s", pattern, filename)
+            return False
 
         # Check include patterns (case-insensitive)
-        for pattern in self.config.file_patterns:
-            if fnmatch.fnmatch(filename_lower, pattern.lower()):
-                return True
+        if self._include.match(filename) is not None:
+            return True
 
-        logger.debug(f"File doesn't match any include pattern: {filename}")
+        logger.debug("File doesn't match any include pattern: %s", filename)
         return False
 
-    def _check_stability(self, file_path: Path) -> None:
-        """Wait for file to become stable, then trigger callback.
+    def _run_checks(self, stop_event: threading.Event) -> None:
+        """Scheduler loop: run each stability check when it comes due.
 
         Args:
-            file_path: Path to the file
+            stop_event: Set (with the condition notified) to end the loop
         """
-        logger.debug(f"Checking stability: {file_path}")
+        while True:
+            with self._cv:
+                while True:
+                    if stop_event.is_set():
+                        return
+                    if not self._checks:
+                        self._cv.wait()
+                        continue
+                    delay = self._checks[0][0] - time.monotonic()
+                    if delay <= 0:
+                        break
+                    self._cv.wait(delay)
+                _, file_key, last_size, start_time = heapq.heappop(self._checks)
+
+            try:
+                self._check_stability(file_key, last_size, start_time)
+            except Exception as e:
+                logger.error(f"Error checking stability of {file_key}: {e}")
+                self._finish(file_key)
+
+    def _check_stability(self, file_key: str, last_size: int, start_time: float) -> None:
+        """Check a pending file once; reschedule it, drop it, or hand it off.
 
+        Args:
+            file_key: Path to the file
+            last_size: File size at the previous check (-1 on the first check)
+            start_time: time.monotonic() when the file became pending
+        """
+        # Check timeout (one clock read per check, reused for rescheduling)
+        now = time.monotonic()
+        elapsed = now - start_time
+        if elapsed > self._timeout:
+            logger.warning(f"Stability timeout after {elapsed:.1f}s: {file_key}")
+            self._finish(file_key)
+            return
+
+        # Get current size (one stat; a missing file raises FileNotFoundError)
         try:
-            start_time = time.time()
-            last_size = -1
-
-            while True:
-                # Check timeout
-                elapsed = time.time() - start_time
-                if elapsed > self.config.stability_timeout_seconds:
-                    logger.warning(
-                        f"Stability timeout after {elapsed:.1f}s: {file_path}"
-                    )
-                    return
-
-                # Check if file still exists
-                if not file_path.exists():
-                    logger.debug(f"File no longer exists: {file_path}")
-                    return
-
-                # Get current size
-                try:
-                    current_size = file_path.stat().st_size
-                except OSError as e:
-                    logger.warning(f"Error checking file size: {e}")
-                    return
-
-                # Check if stable (same size twice and non-zero)
-                if current_size == last_size and current_size > 0:
-                    logger.debug(
-                        f"File stable after {elapsed:.1f}s (size={current_size}): {file_path}"
+            current_size = os.stat(file_key).st_size
+        except FileNotFoundError:
+            logger.debug("File no longer exists: %s", file_key)
+            self._finish(file_key)
+            return
+        except OSError as e:
+            logger.warning(f"Error checking file size: {e}")
+            self._finish(file_key)
+            return
+
+        # Check if stable (same size twice, or closed by its writer, and non-zero)
+        stable = current_size == last_size or file_key in self._closed
+        if stable and current_size > 0:
+            logger.debug(
+                "File stable after %.1fs (size=%d): %s", elapsed, current_size, file_key
+            )
+            # File is stable, trigger callback (stays pending until it returns)
+            logger.info(f"File ready: {file_key}")
+            with self._lock:
+                if file_key not in self._pending:
+                    return  # Dropped by shutdown()
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=_READY_WORKERS, thread_name_prefix="rap-ready"
                     )
-                    break
+                self._executor.submit(self._file_ready, file_key)
+            return
 
-                last_size = current_size
-                time.sleep(self.config.stability_check_seconds)
+        next_check = now + self._check_interval
+        with self._cv:
+            if file_key not in self._pending:
+                return  # Dropped by shutdown()
+            heapq.heappush(self._checks, (next_check, file_key, current_size, start_time))
 
-            # File is stable, trigger callback
-            logger.info(f"File ready: {file_path}")
-            try:
-                self.on_file_ready(file_path)
-            except Exception as e:
-                logger.error(f"Error in file ready callback: {e}")
+    def _file_ready(self, file_key: str) -> None:
+        """Run the file ready callback, then stop tracking the file.
 
+        Args:
+            file_key: Path to the stable file
+        """
+        try:
+            self.on_file_ready(Path(file_key))
+        except Exception as e:
+            logger.error(f"Error in file ready callback: {e}")
         finally:
-            # Remove from pending
-            with self._lock:
-                self._pending.pop(str(file_path), None)
+            self._finish(file_key)
+
+    def shutdown(self) -> None:
+        """Stop the scheduler, pending checks and callbacks not yet started.
+
+        The scheduler thread exits at once rather than sleeping out pending
+        checks. Callbacks already running are left to finish.
+        """
+        with self._cv:
+            self._stop_event.set()
+            self._cv.notify_all()
+            self._worker = None
+            executor, self._executor = self._executor, None
+            self._checks.clear()
+            self._pending.clear()
+            self._last_event.clear()
+            self._closed.clear()
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _finish(self, file_key: str) -> None:
+        """Remove a file from pending and forget its last event time.
+
+        Args:
+            file_key: Path to the file
+        """
+        with self._lock:
+            self._pending.discard(file_key)
+            self._last_event.pop(file_key, None)
+            self._closed.discard(file_key)
 
 
 class FileWatcher:
@@ -218,8 +442,11 @@ class FileWatcher:
 
         logger.info("Stopping file watcher")
         self._observer.stop()
-        self._observer.join(timeout=5)
+        self._observer.join(timeout=1.0)
+        if self._observer.is_alive():
+            logger.warning("Observer did not stop cleanly")
         self._observer = None
+        self._handler.shutdown()
 
     def is_running(self) -> bool:
         """Check if watcher is running."""
@@ -244,28 +471,110 @@ def scan_existing_files(config: WatchConfig) -> list[Path]:
         logger.info(f"Watch folder doesn't exist: {base_folder}")
         return []
 
-    files: list[Path] = []
+    ignore = _FilenamePatterns(config.ignore_patterns)
+    include = _FilenamePatterns(config.file_patterns)
+
+    def scan_subfolder(subfolder: str) -> list[tuple[int, str]]:
+        return _match_files(_iter_files(subfolder), ignore, include)
 
-    for root, _dirs, filenames in os.walk(base_folder):
-        for filename in filenames:
-            file_path = Path(root) / filename
-            filename_lower = filename.lower()
+    files, subfolders = _list_folder(str(base_folder))
 
-            # Check ignore patterns (case-insensitive)
-            should_ignore = False
-            for pattern in config.ignore_patterns:
-                if fnmatch.fnmatch(filename_lower, pattern.lower()):
-                    should_ignore = True
-                    break
+    # (mtime_ns, path) pairs, stat'ed once during the walk for the final sort
+    found = _match_files(files, ignore, include)
+    if len(subfolders) >= _PARALLEL_SCAN_MIN_FOLDERS:
+        # Large trees (or slow volumes) are latency bound, so overlap the
+        # subfolder walks; map() keeps results in walk order
+        with ThreadPoolExecutor(
+            max_workers=_SCAN_WORKERS, thread_name_prefix="rap-scan"
+        ) as pool:
+            results = list(pool.map(scan_subfolder, subfolders))
+    else:
+        results = [scan_subfolder(subfolder) for subfolder in subfolders]
+    for matches in results:
+        found.extend(matches)
 
-            if should_ignore:
-                continue
+    logger.info(f"Found {len(found)} existing files in {base_folder}")
+    found.sort(key=operator.itemgetter(0))
+    return [Path(path) for _, path in found]
 
-            # Check include patterns (case-insensitive)
-            for pattern in config.file_patterns:
-                if fnmatch.fnmatch(filename_lower, pattern.lower()):
-                    files.append(file_path)
-                    break
 
-    logger.info(f"Found {len(files)} existing files in {base_folder}")
-    return sorted(files, key=lambda p: p.stat().st_mtime)
+def _match_files(
+    entries: Iterable[os.DirEntry[str]],
+    ignore: _FilenamePatterns,
+    include: _FilenamePatterns,
+) -> list[tuple[int, str]]:
+    """Filter file entries by name and stat the matches.
+
+    Args:
+        entries: File entries to check
+        ignore: Ignore patterns
+        include: Include patterns
+
+    Returns:
+        (mtime_ns, path) pair for each matching file, in entry order
+    """
+    found: list[tuple[int, str]] = []
+    for entry in entries:
+        filename = entry.name
+
+        # Check ignore patterns (case-insensitive)
+        if ignore.match(filename) is not None:
+            continue
+
+        # Check include patterns (case-insensitive)
+        if include.match(filename) is not None:
+            try:
+                found.append((entry.stat().st_mtime_ns, entry.path))
+            except OSError:
+                continue  # Removed since it was listed
+    return found
+
+
+def _iter_files(folder: str) -> Iterator[os.DirEntry[str]]:
+    """Recursively yield file entries under a folder, like os.walk.
+
+    Files in a folder are yielded before descending into its subfolders.
+    Symlinked folders are not followed, and unreadable folders are skipped.
+
+    Args:
+        folder: Folder to scan
+
+    Yields:
+        DirEntry for each non-directory entry
+    """
+    files, subfolders = _list_folder(folder)
+    yield from files
+    for subfolder in subfolders:
+        yield from _iter_files(subfolder)
+
+
+def _list_folder(folder: str) -> tuple[list[os.DirEntry[str]], list[str]]:
+    """List one folder, splitting its entries into files and subfolders.
+
+    Symlinked folders are left out of the subfolders, and an unreadable
+    folder lists as empty.
+
+    Args:
+        folder: Folder to list
+
+    Returns:
+        Tuple of (non-directory entries, subfolder paths)
+    """
+    try:
+        with os.scandir(folder) as it:
+            entries = list(it)
+    except OSError:
+        return [], []
+
+    files: list[os.DirEntry[str]] = []
+    subfolders: list[str] = []
+    for entry in entries:
+        try:
+            is_dir = entry.is_dir()
+        except OSError:
+            is_dir = False
+        if not is_dir:
+            files.append(entry)
+        elif not entry.is_symlink():
+            subfolders.append(entry.path)
+    return files, subfolders
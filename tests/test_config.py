@@ -5,8 +5,10 @@ from __future__ import annotations
 import json
 import pytest
 from pathlib import Path
+from unittest.mock import patch
 
 from rap_importer_plugin.config import (
+    CONFIG_CACHE_ENV,
     Config,
     WatchConfig,
     WatcherConfig,
@@ -39,6 +41,13 @@ class TestWatchConfig:
         assert not str(config.expanded_base_folder).startswith("~")
         assert "Documents/test" in str(config.expanded_base_folder)
 
+    def test_expanded_base_folder_follows_base_folder(self) -> None:
+        """Cached expansion should be refreshed when base_folder changes."""
+        config = WatchConfig(base_folder="/tmp/first")
+        assert config.expanded_base_folder is config.expanded_base_folder
+        config.base_folder = "/tmp/second"
+        assert config.expanded_base_folder == Path("/tmp/second")
+
 
 class TestScriptConfig:
     """Tests for ScriptConfig."""
@@ -124,6 +133,35 @@ class TestScriptConfig:
         )
         assert config.exclude_paths == ["*/Archive/*", "*/Drafts/*"]
 
+    def test_has_path_filters(self) -> None:
+        """has_path_filters should reflect whether any include/exclude is set."""
+        assert ScriptConfig(name="t", type="python", path="t.py").has_path_filters is False
+        assert ScriptConfig(
+            name="t", type="python", path="t.py", include_paths=["BUSI*/*"]
+        ).has_path_filters is True
+        assert ScriptConfig(
+            name="t", type="python", path="t.py", exclude_paths=["*/Draft/*"]
+        ).has_path_filters is True
+
+    def test_compiled_paths_follow_changes(self) -> None:
+        """Compiled filters should be refreshed when the pattern lists change."""
+        config = ScriptConfig(
+            name="t", type="python", path="t.py", include_paths=["BUSI*/*"]
+        )
+        include = config.compiled_include_paths
+        assert include is config.compiled_include_paths
+        assert config.compiled_exclude_paths is None
+
+        config.include_paths = ["HIST*/*"]
+        assert config.compiled_include_paths is not None
+        assert config.compiled_include_paths.match("HIST101/a.pdf")
+        assert not config.compiled_include_paths.match("BUSI770/a.pdf")
+
+        config.exclude_paths.append("*/Draft/*")
+        assert config.has_path_filters is True
+        assert config.compiled_exclude_paths is not None
+        assert config.compiled_exclude_paths.match("HIST101/Draft/a.pdf")
+
     def test_include_and_exclude_paths_together(self) -> None:
         """Should accept both include and exclude patterns."""
         config = ScriptConfig(
@@ -173,6 +211,13 @@ class TestLoggingConfig:
         config = LoggingConfig(file="~/test.log")
         assert not str(config.expanded_file).startswith("~")
 
+    def test_expanded_file_follows_file(self) -> None:
+        """Cached expansion should be refreshed when file changes."""
+        config = LoggingConfig(file="/tmp/first.log")
+        assert config.expanded_file is config.expanded_file
+        config.file = "/tmp/second.log"
+        assert config.expanded_file == Path("/tmp/second.log")
+
 
 class TestWatcherConfig:
     """Tests for WatcherConfig."""
@@ -461,6 +506,32 @@ class TestLoadConfig:
             load_config(config_path)
 
 
+class TestConfigFromDict:
+    """Tests for building config from parsed data."""
+
+    def test_from_dict_matches_load_config(self, tmp_path: Path) -> None:
+        """from_dict should build the same Config as load_config."""
+        config_data = {
+            "watchers": [{
+                "name": "Test",
+                "watch": {"base_folder": "~/test"},
+                "pipeline": {"scripts": [{"name": "S", "type": "python", "path": "s.py"}]}
+            }],
+            "logging": {"level": "DEBUG"},
+        }
+        config_path = tmp_path / "config.json"
+        config_path.write_text(json.dumps(config_data))
+
+        assert Config.from_dict(config_data) == load_config(config_path)
+
+    def test_from_dict_requires_watchers(self) -> None:
+        """from_dict should apply the same required-field checks."""
+        with pytest.raises(ValueError, match="watchers"):
+            Config.from_dict({})
+        with pytest.raises(ValueError, match="non-empty"):
+            Config.from_dict({"watchers": []})
+
+
 class TestSchemaValidationOnLoad:
     """Tests for JSON schema validation in load_config."""
 
@@ -587,6 +658,142 @@ class TestSchemaValidationOnLoad:
         assert config.watchers[0].name == "Test"
 
 
+class TestSchemaValidationCache:
+    """Tests for reuse of schema validation across loads."""
+
+    def test_unchanged_config_validated_once(self, tmp_path: Path) -> None:
+        """Reloading an unchanged config should skip schema validation."""
+        config_dir = tmp_path / "config"
+        config_dir.mkdir()
+        (config_dir / "config.schema.json").write_text(json.dumps({"type": "object"}))
+
+        config_data = {
+            "watchers": [{
+                "name": "Test",
+                "watch": {"base_folder": "~/test"},
+                "pipeline": {"scripts": []}
+            }]
+        }
+        config_path = config_dir / "config.json"
+        config_path.write_text(json.dumps(config_data))
+
+        with patch("rap_importer_plugin.config.jsonschema.validate") as validate:
+            first = load_config(config_path)
+            second = load_config(config_path)
+            assert validate.call_count == 1
+
+            # Edited config is validated again and reflected in the result
+            config_data["watchers"][0]["name"] = "Edited"
+            config_path.write_text(json.dumps(config_data))
+            third = load_config(config_path)
+            assert validate.call_count == 2
+
+        assert first is not second
+        assert first.watchers[0].name == "Test"
+        assert third.watchers[0].name == "Edited"
+
+    def test_config_parsed_once_per_load(self, tmp_path: Path) -> None:
+        """Validation should reuse the parsed config rather than parse it again."""
+        config_dir = tmp_path / "config"
+        config_dir.mkdir()
+        schema_raw = json.dumps({"type": "object", "title": "parse-once"}).encode()
+        (config_dir / "config.schema.json").write_bytes(schema_raw)
+        config_path = config_dir / "config.json"
+        config_path.write_text(json.dumps({
+            "watchers": [{
+                "name": "Parsed",
+                "watch": {"base_folder": "~/test"},
+                "pipeline": {"scripts": []}
+            }]
+        }))
+        config_raw = config_path.read_bytes()
+
+        with patch(
+            "rap_importer_plugin.config._json_loads", side_effect=json.loads
+        ) as loads, patch("rap_importer_plugin.config.jsonschema.validate") as validate:
+            config = load_config(config_path)
+
+        parsed = [c.args[0] for c in loads.call_args_list]
+        assert parsed.count(config_raw) == 1
+        assert validate.call_count == 1
+        assert config.watchers[0].name == "Parsed"
+
+
+class TestConfigCache:
+    """Tests for the opt-in pickled config cache."""
+
+    CONFIG_DATA = {
+        "watchers": [{
+            "name": "Test",
+            "watch": {"base_folder": "~/test"},
+            "pipeline": {"scripts": [{
+                "name": "Script",
+                "type": "python",
+                "path": "test.py",
+                "include_paths": ["*/Books/*"],
+            }]}
+        }]
+    }
+
+    def _write_config(self, tmp_path: Path, data: dict) -> Path:
+        config_path = tmp_path / "config.json"
+        config_path.write_text(json.dumps(data))
+        return config_path
+
+    def test_disabled_by_default(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Without RAP_CONFIG_CACHE=1, no cache file should be written."""
+        monkeypatch.delenv(CONFIG_CACHE_ENV, raising=False)
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+
+        load_config(self._write_config(tmp_path, self.CONFIG_DATA))
+        assert not (tmp_path / "cache").exists()
+
+    def test_unchanged_config_loaded_from_cache(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A second load of an unchanged config should skip parsing."""
+        monkeypatch.setenv(CONFIG_CACHE_ENV, "1")
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+        config_path = self._write_config(tmp_path, self.CONFIG_DATA)
+
+        first = load_config(config_path)
+        assert list((tmp_path / "cache" / "rap-importer").glob("*.cache"))
+
+        with patch("rap_importer_plugin.config._parse_watcher_config") as parse:
+            second = load_config(config_path)
+            parse.assert_not_called()
+
+        assert second == first
+        assert second is not first
+        script = second.watchers[0].pipeline.scripts[0]
+        assert script.compiled_include_paths.match("/x/Books/a.pdf")
+
+    def test_edited_config_reparsed(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Editing config.json should invalidate the cache."""
+        monkeypatch.setenv(CONFIG_CACHE_ENV, "1")
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+        config_path = self._write_config(tmp_path, self.CONFIG_DATA)
+        load_config(config_path)
+
+        edited = json.loads(json.dumps(self.CONFIG_DATA))
+        edited["watchers"][0]["name"] = "Edited"
+        self._write_config(tmp_path, edited)
+
+        assert load_config(config_path).watchers[0].name == "Edited"
+
+    def test_corrupt_cache_ignored(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """An unreadable cache file should fall back to parsing."""
+        monkeypatch.setenv(CONFIG_CACHE_ENV, "1")
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+        config_path = self._write_config(tmp_path, self.CONFIG_DATA)
+        load_config(config_path)
+
+        for cache_file in (tmp_path / "cache" / "rap-importer").glob("*.cache"):
+            cache_file.write_bytes(b"not a pickle")
+
+        assert load_config(config_path).watchers[0].name == "Test"
+
+
 class TestFindConfigFile:
     """Tests for finding config file."""
 
@@ -613,6 +820,18 @@ class TestFindConfigFile:
         found = find_config_file(subdir)
         assert found == config_path
 
+    def test_skips_directory_named_config_json(self, tmp_path: Path) -> None:
+        """A directory named config.json should not count as a config file."""
+        subdir = tmp_path / "subdir"
+        (subdir / "config" / "config.json").mkdir(parents=True)
+
+        config_dir = tmp_path / "config"
+        config_dir.mkdir()
+        config_path = config_dir / "config.json"
+        config_path.write_text('{}')
+
+        assert find_config_file(subdir) == config_path
+
     def test_raises_when_not_found(self, tmp_path: Path) -> None:
         """Should raise FileNotFoundError when no config found."""
         subdir = tmp_path / "subdir"
@@ -2,12 +2,27 @@
 
 from __future__ import annotations
 
+from dataclasses import replace
 from pathlib import Path
 
+import pytest
+
 from rap_importer_plugin.executor import FileVariables, ScriptExecutor
 from rap_importer_plugin.config import ScriptConfig
 
 
+@pytest.fixture
+def file_vars() -> FileVariables:
+    """Variables for a file at DB/file.pdf, shared by the command tests."""
+    return FileVariables(
+        file_path="/test/file.pdf",
+        relative_path="DB/file.pdf",
+        filename="file.pdf",
+        database="DB",
+        group_path=""
+    )
+
+
 class TestFileVariables:
     """Tests for FileVariables."""
 
@@ -45,6 +60,18 @@ class TestFileVariables:
         assert vars.database == "MyDatabase"
         assert vars.group_path == "Inbox/Project"
 
+    def test_from_file_outside_base(self) -> None:
+        """Files outside the base folder should use their full path."""
+        base = Path("/home/user/imports")
+        file = Path("/home/user/importsX/MyDatabase/document.pdf")
+
+        vars = FileVariables.from_file(file, base)
+
+        assert vars.relative_path == str(file)
+        assert vars.filename == "document.pdf"
+        assert vars.database == "/"
+        assert vars.group_path == "home/user/importsX/MyDatabase"
+
     def test_as_dict(self) -> None:
         """Should return variables as dictionary."""
         vars = FileVariables(
@@ -142,6 +169,30 @@ class TestScriptExecutor:
 
         assert result == ["/path/to/file.pdf", "DB/file.pdf"]
 
+    def test_substitute_matches_str_format(self) -> None:
+        """Template substitution should behave exactly like str.format()."""
+        executor = ScriptExecutor()
+        vars = FileVariables(
+            file_path="/path/to/file.pdf",
+            relative_path="DB/file.pdf",
+            filename="file.pdf",
+            database="DB",
+            group_path=""
+        )
+
+        args = [
+            "--db={database} --name={filename}",
+            "{{literal}} {filename}",
+            "{filename!r}",
+            "{database:>4}",
+            "{filename[0]}",
+            "no placeholders",
+        ]
+
+        result = executor._substitute_args(args, vars)
+
+        assert result == [arg.format(**vars.as_dict()) for arg in args]
+
     def test_execute_missing_script(self, tmp_path: Path) -> None:
         """Should return error for missing script."""
         executor = ScriptExecutor(tmp_path)
@@ -188,6 +239,33 @@ class TestScriptExecutor:
         assert result.success is True
         assert result.output == "success"
 
+    def test_execute_python_invalid_utf8_output(self, tmp_path: Path) -> None:
+        """Undecodable output should be replaced, not fail the script."""
+        script_path = tmp_path / "test.py"
+        script_path.write_text(
+            'import sys\n'
+            'sys.stdout.buffer.write(b"ok \\xff\\r\\nnext")\n'
+        )
+
+        executor = ScriptExecutor(tmp_path)
+        script = ScriptConfig(
+            name="test",
+            type="python",
+            path="test.py"
+        )
+        vars = FileVariables(
+            file_path="/test",
+            relative_path="test",
+            filename="test",
+            database="test",
+            group_path=""
+        )
+
+        result = executor.execute(script, vars)
+
+        assert result.success is True
+        assert result.output == "ok \ufffd\nnext"
+
     def test_execute_python_with_args(self, tmp_path: Path) -> None:
         """Should pass args to Python script."""
         # Create a script that prints its args
@@ -240,7 +318,7 @@ print(f"file={sys.argv[2]}")
 
         assert result.success is False
 
-    def test_execute_command_simple(self, tmp_path: Path) -> None:
+    def test_execute_command_simple(self, tmp_path: Path, file_vars: FileVariables) -> None:
         """Should execute a simple command."""
         executor = ScriptExecutor(tmp_path)
         script = ScriptConfig(
@@ -248,20 +326,14 @@ print(f"file={sys.argv[2]}")
             type="command",
             path="echo hello"
         )
-        vars = FileVariables(
-            file_path="/test/file.pdf",
-            relative_path="DB/file.pdf",
-            filename="file.pdf",
-            database="DB",
-            group_path=""
-        )
-
-        result = executor.execute(script, vars)
+        result = executor.execute(script, file_vars)
 
         assert result.success is True
         assert "hello" in result.output
 
-    def test_execute_command_with_variable_substitution(self, tmp_path: Path) -> None:
+    def test_execute_command_with_variable_substitution(
+        self, tmp_path: Path, file_vars: FileVariables
+    ) -> None:
         """Should substitute variables in command string."""
         executor = ScriptExecutor(tmp_path)
         script = ScriptConfig(
@@ -269,20 +341,12 @@ print(f"file={sys.argv[2]}")
             type="command",
             path="echo {filename}"
         )
-        vars = FileVariables(
-            file_path="/test/file.pdf",
-            relative_path="DB/file.pdf",
-            filename="file.pdf",
-            database="DB",
-            group_path=""
-        )
-
-        result = executor.execute(script, vars)
+        result = executor.execute(script, file_vars)
 
         assert result.success is True
         assert "file.pdf" in result.output
 
-    def test_execute_command_with_args(self, tmp_path: Path) -> None:
+    def test_execute_command_with_args(self, tmp_path: Path, file_vars: FileVariables) -> None:
         """Should append args to command."""
         executor = ScriptExecutor(tmp_path)
         script = ScriptConfig(
@@ -291,20 +355,14 @@ print(f"file={sys.argv[2]}")
             path="echo base",
             args=["extra", "{database}"]
         )
-        vars = FileVariables(
-            file_path="/test/file.pdf",
-            relative_path="DB/file.pdf",
-            filename="file.pdf",
-            database="TestDB",
-            group_path=""
-        )
+        vars = replace(file_vars, database="TestDB")
 
         result = executor.execute(script, vars)
 
         assert result.success is True
         assert "TestDB" in result.output
 
-    def test_execute_command_with_cwd(self, tmp_path: Path) -> None:
+    def test_execute_command_with_cwd(self, tmp_path: Path, file_vars: FileVariables) -> None:
         """Should execute command in specified working directory."""
         work_dir = tmp_path / "workdir"
         work_dir.mkdir()
@@ -316,20 +374,12 @@ print(f"file={sys.argv[2]}")
             path="pwd",
             cwd=str(work_dir)
         )
-        vars = FileVariables(
-            file_path="/test/file.pdf",
-            relative_path="DB/file.pdf",
-            filename="file.pdf",
-            database="DB",
-            group_path=""
-        )
-
-        result = executor.execute(script, vars)
+        result = executor.execute(script, file_vars)
 
         assert result.success is True
         assert "workdir" in result.output
 
-    def test_execute_command_cwd_with_tilde(self, tmp_path: Path) -> None:
+    def test_execute_command_cwd_with_tilde(self, tmp_path: Path, file_vars: FileVariables) -> None:
         """Should expand ~ in cwd path."""
         import os
 
@@ -340,20 +390,12 @@ print(f"file={sys.argv[2]}")
             path="pwd",
             cwd="~"
         )
-        vars = FileVariables(
-            file_path="/test/file.pdf",
-            relative_path="DB/file.pdf",
-            filename="file.pdf",
-            database="DB",
-            group_path=""
-        )
-
-        result = executor.execute(script, vars)
+        result = executor.execute(script, file_vars)
 
         assert result.success is True
         assert os.path.expanduser("~") in result.output
 
-    def test_execute_command_missing_cwd(self, tmp_path: Path) -> None:
+    def test_execute_command_missing_cwd(self, tmp_path: Path, file_vars: FileVariables) -> None:
         """Should fail if cwd directory does not exist."""
         executor = ScriptExecutor(tmp_path)
         script = ScriptConfig(
@@ -362,20 +404,14 @@ print(f"file={sys.argv[2]}")
             path="echo hello",
             cwd="/nonexistent/directory"
         )
-        vars = FileVariables(
-            file_path="/test/file.pdf",
-            relative_path="DB/file.pdf",
-            filename="file.pdf",
-            database="DB",
-            group_path=""
-        )
-
-        result = executor.execute(script, vars)
+        result = executor.execute(script, file_vars)
 
         assert result.success is False
         assert "does not exist" in result.error
 
-    def test_execute_command_with_quoted_args(self, tmp_path: Path) -> None:
+    def test_execute_command_with_quoted_args(
+        self, tmp_path: Path, file_vars: FileVariables
+    ) -> None:
         """Should handle quoted arguments in command string."""
         executor = ScriptExecutor(tmp_path)
         script = ScriptConfig(
@@ -383,20 +419,12 @@ print(f"file={sys.argv[2]}")
             type="command",
             path='echo "hello world"'
         )
-        vars = FileVariables(
-            file_path="/test/file.pdf",
-            relative_path="DB/file.pdf",
-            filename="file.pdf",
-            database="DB",
-            group_path=""
-        )
-
-        result = executor.execute(script, vars)
+        result = executor.execute(script, file_vars)
 
         assert result.success is True
         assert "hello world" in result.output
 
-    def test_execute_command_invalid_parse(self, tmp_path: Path) -> None:
+    def test_execute_command_invalid_parse(self, tmp_path: Path, file_vars: FileVariables) -> None:
         """Should handle unparseable command string."""
         executor = ScriptExecutor(tmp_path)
         script = ScriptConfig(
@@ -404,15 +432,7 @@ print(f"file={sys.argv[2]}")
             type="command",
             path='echo "unclosed quote'
         )
-        vars = FileVariables(
-            file_path="/test/file.pdf",
-            relative_path="DB/file.pdf",
-            filename="file.pdf",
-            database="DB",
-            group_path=""
-        )
-
-        result = executor.execute(script, vars)
+        result = executor.execute(script, file_vars)
 
         assert result.success is False
         assert "parse" in result.error.lower()
@@ -463,7 +483,9 @@ print(f"file={sys.argv[2]}")
         assert result.success is True
         assert "--output-dir=/inbox/Folder/SubFolder/" in result.output
 
-    def test_execute_command_clears_virtualenv(self, tmp_path: Path, monkeypatch) -> None:
+    def test_execute_command_clears_virtualenv(
+        self, tmp_path: Path, monkeypatch, file_vars: FileVariables
+    ) -> None:
         """Should clear VIRTUAL_ENV from environment for command type."""
         # Set VIRTUAL_ENV in the current environment
         monkeypatch.setenv("VIRTUAL_ENV", "/some/other/venv")
@@ -475,20 +497,29 @@ print(f"file={sys.argv[2]}")
             type="command",
             path="env"
         )
-        vars = FileVariables(
-            file_path="/test/file.pdf",
-            relative_path="DB/file.pdf",
-            filename="file.pdf",
-            database="DB",
-            group_path=""
-        )
-
-        result = executor.execute(script, vars)
+        result = executor.execute(script, file_vars)
 
         assert result.success is True
         # VIRTUAL_ENV should NOT be in the output
         assert "VIRTUAL_ENV=" not in result.output
 
+    def test_execute_command_sees_live_environment(
+        self, tmp_path: Path, monkeypatch, file_vars: FileVariables
+    ) -> None:
+        """Variables set after the executor is created should reach commands."""
+        executor = ScriptExecutor(tmp_path)
+        monkeypatch.setenv("RAP_TEST_LATE_VAR", "late-value")
+
+        script = ScriptConfig(
+            name="test",
+            type="command",
+            path="env"
+        )
+        result = executor.execute(script, file_vars)
+
+        assert result.success is True
+        assert "RAP_TEST_LATE_VAR=late-value" in result.output
+
     def test_execute_command_with_log_level(self, tmp_path: Path) -> None:
         """Should substitute log_level variable in command args."""
         executor = ScriptExecutor(tmp_path)
@@ -512,7 +543,9 @@ print(f"file={sys.argv[2]}")
         assert result.success is True
         assert "--log-level=DEBUG" in result.output
 
-    def test_execute_command_unknown_variable_in_args(self, tmp_path: Path) -> None:
+    def test_execute_command_unknown_variable_in_args(
+        self, tmp_path: Path, file_vars: FileVariables
+    ) -> None:
         """Should return descriptive error for unknown variable in args."""
         executor = ScriptExecutor(tmp_path)
         script = ScriptConfig(
@@ -521,22 +554,16 @@ print(f"file={sys.argv[2]}")
             path="echo",
             args=["{unknown_var}", "{another_bad_var}"]
         )
-        vars = FileVariables(
-            file_path="/test/file.pdf",
-            relative_path="DB/file.pdf",
-            filename="file.pdf",
-            database="DB",
-            group_path=""
-        )
-
-        result = executor.execute(script, vars)
+        result = executor.execute(script, file_vars)
 
         assert result.success is False
         assert "unknown_var" in result.error
         assert "Available variables" in result.error
         assert "{base_folder}" in result.error
 
-    def test_execute_command_unknown_variable_in_path(self, tmp_path: Path) -> None:
+    def test_execute_command_unknown_variable_in_path(
+        self, tmp_path: Path, file_vars: FileVariables
+    ) -> None:
         """Should return descriptive error for unknown variable in command path."""
         executor = ScriptExecutor(tmp_path)
         script = ScriptConfig(
@@ -544,15 +571,7 @@ print(f"file={sys.argv[2]}")
             type="command",
             path="echo {nonexistent}"
         )
-        vars = FileVariables(
-            file_path="/test/file.pdf",
-            relative_path="DB/file.pdf",
-            filename="file.pdf",
-            database="DB",
-            group_path=""
-        )
-
-        result = executor.execute(script, vars)
+        result = executor.execute(script, file_vars)
 
         assert result.success is False
         assert "nonexistent" in result.error
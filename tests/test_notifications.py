@@ -0,0 +1,359 @@
+"""Tests for notification queueing and delivery."""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from rap_importer_plugin import notifications
+from rap_importer_plugin.config import NotificationsConfig
+
+
+@pytest.fixture
+def delivered(monkeypatch: pytest.MonkeyPatch) -> Iterator[list[tuple[str, str, bool]]]:
+    """Enable notifications and record deliveries instead of showing them."""
+    delivered: list[tuple[str, str, bool]] = []
+
+    def record(title: str, message: str, sound: bool) -> bool:
+        delivered.append((title, message, sound))
+        return True
+
+    monkeypatch.setattr(notifications, "_config", NotificationsConfig(on_success=True))
+    monkeypatch.setattr(notifications, "_deliver", record)
+    notifications._start_worker()
+    yield delivered
+    notifications.flush_notifications()
+
+
+class FakeNotification:
+    """Stand-in for NSUserNotification."""
+
+    def __init__(self) -> None:
+        self.title = ""
+        self.message = ""
+        self.sound_name: str | None = None
+
+    @classmethod
+    def alloc(cls) -> FakeNotification:
+        return cls()
+
+    def init(self) -> FakeNotification:
+        return self
+
+    def setTitle_(self, title: str) -> None:
+        self.title = title
+
+    def setInformativeText_(self, message: str) -> None:
+        self.message = message
+
+    def setSoundName_(self, sound_name: str) -> None:
+        self.sound_name = sound_name
+
+
+class FakeCenter:
+    """Stand-in for NSUserNotificationCenter that records deliveries."""
+
+    def __init__(self) -> None:
+        self.delivered: list[FakeNotification] = []
+
+    def deliverNotification_(self, notification: FakeNotification) -> None:
+        self.delivered.append(notification)
+
+
+class TestNotify:
+    """Tests for queueing notifications."""
+
+    def test_returns_without_waiting_for_delivery(
+        self, monkeypatch: pytest.MonkeyPatch, delivered: list[tuple[str, str, bool]]
+    ) -> None:
+        """notify() should queue and return while a delivery is still blocked."""
+        release = threading.Event()
+
+        def slow_deliver(title: str, message: str, sound: bool) -> bool:
+            release.wait(5.0)
+            delivered.append((title, message, sound))
+            return True
+
+        monkeypatch.setattr(notifications, "_deliver", slow_deliver)
+
+        start = time.monotonic()
+        assert notifications.notify("Import Complete", "a.pdf imported") is True
+        assert time.monotonic() - start < 1.0
+
+        release.set()
+        notifications.flush_notifications()
+        assert delivered == [("Import Complete", "a.pdf imported", False)]
+
+    def test_nothing_queued_without_config(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Before setup_notifications(), notify() should drop the request."""
+        monkeypatch.setattr(notifications, "_config", None)
+        pending = notifications._queue.unfinished_tasks
+
+        assert notifications.notify("Title", "message") is False
+        assert notifications.notify_error("Title", "message") is False
+        assert notifications.notify_success("Title", "message") is False
+        assert notifications._queue.unfinished_tasks == pending
+
+    def test_nothing_queued_when_disabled(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Disabled notifications (or disabled kinds) should not be queued."""
+        pending = notifications._queue.unfinished_tasks
+
+        monkeypatch.setattr(notifications, "_config", NotificationsConfig(enabled=False))
+        assert notifications.notify("Title", "message") is False
+        assert notifications.notify_error("Title", "message") is False
+
+        monkeypatch.setattr(
+            notifications, "_config", NotificationsConfig(on_error=False, on_success=False)
+        )
+        assert notifications.notify_error("Title", "message") is False
+        assert notifications.notify_success("Title", "message") is False
+
+        assert notifications._queue.unfinished_tasks == pending
+
+
+class TestFlushNotifications:
+    """Tests for the bounded exit-time flush."""
+
+    def test_stops_waiting_after_timeout(
+        self, monkeypatch: pytest.MonkeyPatch, delivered: list[tuple[str, str, bool]]
+    ) -> None:
+        """A stuck delivery should not hold flush_notifications() past its timeout."""
+        release = threading.Event()
+        monkeypatch.setattr(notifications, "_deliver", lambda *_args: release.wait(5.0))
+        notifications.notify("Import Failed", "a.pdf: error")
+
+        start = time.monotonic()
+        notifications.flush_notifications(timeout=0.2)
+        elapsed = time.monotonic() - start
+
+        assert 0.2 <= elapsed < 2.0
+        assert notifications._queue.unfinished_tasks
+
+        release.set()
+        notifications.flush_notifications()
+        assert not notifications._queue.unfinished_tasks
+
+
+class TestCoalesce:
+    """Tests for merging a backlog of notifications."""
+
+    def test_keeps_order_of_first_arrival(self) -> None:
+        """One request per title, ordered by each title's first request."""
+        batch = [
+            ("Import Failed", "a.pdf: error", True),
+            ("Import Complete", "b.pdf imported", False),
+            ("Import Failed", "c.pdf: error", True),
+        ]
+        assert [title for title, _, _ in notifications._coalesce(batch)] == [
+            "Import Failed",
+            "Import Complete",
+        ]
+
+    def test_lists_distinct_messages(self) -> None:
+        """Merged failures should still name every file, once each."""
+        batch = [
+            ("Import Failed", "a.pdf: error", True),
+            ("Import Failed", "b.pdf: error", True),
+            ("Import Failed", "a.pdf: error", True),
+        ]
+        assert notifications._coalesce(batch) == [
+            ("Import Failed", "a.pdf: error\nb.pdf: error", True),
+        ]
+
+    def test_identical_messages_shown_once(self) -> None:
+        """Repeats of the same message should not be listed again."""
+        batch = [("Manual Run Complete", "Pipeline completed successfully", False)] * 3
+        assert notifications._coalesce(batch) == [
+            ("Manual Run Complete", "Pipeline completed successfully", False),
+        ]
+
+    def test_counts_messages_beyond_limit(self) -> None:
+        """Messages past the listed limit should be summarized as (+N more)."""
+        batch = [("Import Failed", f"{i}.pdf: error", True) for i in range(5)]
+        [(_, message, _)] = notifications._coalesce(batch)
+        assert message.splitlines() == [
+            "0.pdf: error",
+            "1.pdf: error",
+            "2.pdf: error",
+            "(+2 more)",
+        ]
+
+    def test_sound_if_any_request_asked(self) -> None:
+        """A merged request should play a sound if any of its requests did."""
+        batch = [
+            ("Import Failed", "a.pdf: error", False),
+            ("Import Failed", "b.pdf: error", True),
+            ("Import Failed", "c.pdf: error", False),
+        ]
+        [(_, _, sound)] = notifications._coalesce(batch)
+        assert sound is True
+
+
+class TestCompileNotifyScript:
+    """Tests for the cached osascript notification script."""
+
+    @pytest.fixture
+    def osacompile(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> list[list[str]]:
+        """Redirect the cache folder to tmp_path and fake osacompile."""
+        calls: list[list[str]] = []
+
+        def fake_run(cmd: list[str], **_kwargs: Any) -> subprocess.CompletedProcess[bytes]:
+            calls.append(cmd)
+            Path(cmd[2]).write_bytes(b"compiled")
+            return subprocess.CompletedProcess(cmd, 0)
+
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        monkeypatch.setattr(notifications.subprocess, "run", fake_run)
+        return calls
+
+    def test_compiles_into_user_cache_dir(
+        self, tmp_path: Path, osacompile: list[list[str]]
+    ) -> None:
+        """The script should be written and compiled under $XDG_CACHE_HOME."""
+        compiled = notifications._compile_notify_script()
+
+        assert compiled == tmp_path / "rap-importer" / "notify.scpt"
+        source = tmp_path / "rap-importer" / "notify.applescript"
+        assert source.read_text() == notifications._NOTIFY_SCRIPT_SOURCE
+        assert osacompile == [["osacompile", "-o", str(compiled), str(source)]]
+
+    def test_reuses_up_to_date_script(self, osacompile: list[list[str]]) -> None:
+        """A compiled script newer than its source should not be recompiled."""
+        first = notifications._compile_notify_script()
+        second = notifications._compile_notify_script()
+
+        assert second == first
+        assert len(osacompile) == 1
+
+    def test_recompiles_stale_script(self, osacompile: list[list[str]]) -> None:
+        """A compiled script older than its source should be rebuilt."""
+        compiled = notifications._compile_notify_script()
+        assert compiled is not None
+        os.utime(compiled, ns=(0, 0))
+
+        assert notifications._compile_notify_script() == compiled
+        assert len(osacompile) == 2
+
+    def test_failure_falls_back_to_inline(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """If osacompile can't run, no compiled script should be used."""
+
+        def missing_osacompile(*_args: Any, **_kwargs: Any) -> None:
+            raise FileNotFoundError("osacompile")
+
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        monkeypatch.setattr(notifications.subprocess, "run", missing_osacompile)
+
+        assert notifications._compile_notify_script() is None
+
+    def test_setup_uses_cached_script(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, osacompile: list[list[str]]
+    ) -> None:
+        """setup_notifications() without a native center should use the cache folder."""
+        monkeypatch.setattr(notifications, "_config", None)
+        monkeypatch.setattr(notifications, "_native", None)
+        monkeypatch.setattr(notifications, "_compiled_script", None)
+        monkeypatch.setattr(notifications, "_get_native_notifier", lambda: None)
+
+        notifications.setup_notifications(NotificationsConfig())
+
+        assert notifications._compiled_script == tmp_path / "rap-importer" / "notify.scpt"
+        assert len(osacompile) == 1
+
+
+class TestDeliver:
+    """Tests for the native and osascript delivery backends."""
+
+    def test_native_posts_inside_autorelease_pool(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """With a center, notifications should be posted natively in a fresh pool."""
+        center = FakeCenter()
+        pools: list[str] = []
+
+        @contextmanager
+        def autorelease_pool() -> Iterator[None]:
+            pools.append("enter")
+            yield
+            pools.append("exit")
+
+        native = notifications._NativeNotifier(
+            center=center,
+            notification_class=FakeNotification,
+            sound_name="Default",
+            autorelease_pool=autorelease_pool,
+        )
+        monkeypatch.setattr(notifications, "_native", native)
+
+        def no_osascript(*_args: Any, **_kwargs: Any) -> None:
+            raise AssertionError("osascript should not run")
+
+        monkeypatch.setattr(notifications.subprocess, "run", no_osascript)
+
+        assert notifications._deliver("Import Failed", "a.pdf: error", True) is True
+
+        [notification] = center.delivered
+        assert notification.title == "Import Failed"
+        assert notification.message == "a.pdf: error"
+        assert notification.sound_name == "Default"
+        assert pools == ["enter", "exit"]
+
+    def test_native_error_returns_false(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """A failing native delivery should be reported, not raised."""
+        center = FakeCenter()
+
+        def broken(_notification: FakeNotification) -> None:
+            raise RuntimeError("no center")
+
+        center.deliverNotification_ = broken  # type: ignore[method-assign]
+        native = notifications._NativeNotifier(
+            center=center,
+            notification_class=FakeNotification,
+            sound_name="Default",
+            autorelease_pool=nullcontext,
+        )
+        monkeypatch.setattr(notifications, "_native", native)
+
+        assert notifications._deliver("Title", "message", False) is False
+
+    def test_falls_back_to_osascript_without_center(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Without a native center, notifications should go through osascript."""
+        calls: list[list[str]] = []
+
+        def fake_run(cmd: list[str], **_kwargs: Any) -> subprocess.CompletedProcess[bytes]:
+            calls.append(cmd)
+            return subprocess.CompletedProcess(cmd, 0)
+
+        monkeypatch.setattr(notifications, "_native", None)
+        monkeypatch.setattr(notifications, "_compiled_script", None)
+        monkeypatch.setattr(notifications.subprocess, "run", fake_run)
+
+        assert notifications._deliver("Import Failed", 'say "hi"', False) is True
+        assert calls == [[
+            "osascript",
+            "-e",
+            'display notification "say \\"hi\\"" with title "Import Failed"',
+        ]]
+
+    def test_no_native_notifier_without_pyobjc(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Without PyObjC, no native notifier should be resolved."""
+        monkeypatch.setitem(sys.modules, "objc", None)
+        monkeypatch.setitem(sys.modules, "Foundation", None)
+
+        assert notifications._get_native_notifier() is None
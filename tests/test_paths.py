@@ -6,7 +6,7 @@ from unittest import mock
 
 import pytest
 
-from rap_importer_plugin.paths import expand_path, expand_path_to_path
+from rap_importer_plugin.paths import expand_path, expand_path_to_path, user_cache_dir
 
 
 class TestExpandPath:
@@ -57,6 +57,13 @@ class TestExpandPath:
         result = expand_path("relative/path")
         assert result == "relative/path"
 
+    def test_reflects_env_changes_after_caching(self):
+        """Test that a memoized expansion follows changes to referenced vars."""
+        with mock.patch.dict(os.environ, {"TEST_VAR": "/first"}):
+            assert expand_path("${TEST_VAR}/subdir") == "/first/subdir"
+        with mock.patch.dict(os.environ, {"TEST_VAR": "/second"}):
+            assert expand_path("${TEST_VAR}/subdir") == "/second/subdir"
+
 
 class TestExpandPathToPath:
     """Tests for expand_path_to_path function."""
@@ -77,3 +84,25 @@ class TestExpandPathToPath:
         with mock.patch.dict(os.environ, {"TEST_BASE": "/test"}):
             result = expand_path_to_path("${TEST_BASE}/subdir")
             assert result == Path("/test/subdir")
+
+    def test_reflects_env_changes_between_calls(self):
+        """Test that repeated calls follow changes to referenced env vars."""
+        with mock.patch.dict(os.environ, {"TEST_BASE": "/first"}):
+            first = expand_path_to_path("${TEST_BASE}/subdir")
+            assert expand_path_to_path("${TEST_BASE}/subdir") == first
+        with mock.patch.dict(os.environ, {"TEST_BASE": "/second"}):
+            assert expand_path_to_path("${TEST_BASE}/subdir") == Path("/second/subdir")
+
+
+class TestUserCacheDir:
+    """Tests for user_cache_dir function."""
+
+    def test_uses_xdg_cache_home(self):
+        """Test that $XDG_CACHE_HOME is used when set."""
+        with mock.patch.dict(os.environ, {"XDG_CACHE_HOME": "/tmp/cache"}):
+            assert user_cache_dir() == Path("/tmp/cache/rap-importer")
+
+    def test_defaults_to_library_caches(self):
+        """Test that ~/Library/Caches is used without $XDG_CACHE_HOME."""
+        with mock.patch.dict(os.environ, {"XDG_CACHE_HOME": ""}):
+            assert user_cache_dir() == Path.home() / "Library" / "Caches" / "rap-importer"
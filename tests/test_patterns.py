@@ -0,0 +1,80 @@
+"""Tests for glob pattern compilation."""
+
+import fnmatch
+import re
+
+import pytest
+
+from rap_importer_plugin.patterns import compile_union, matched_index
+
+
+class TestCompileUnion:
+    """Tests for compile_union and matched_index functions."""
+
+    PATTERNS = ["*/Archive/*", "Liberty*/*", "*/Week0?/*"]
+
+    @pytest.mark.parametrize(
+        "path",
+        [
+            "Liberty/Archive/file.pdf",
+            "Liberty University/BUSI770/file.pdf",
+            "DB/Week05/file.pdf",
+            "DB/Week10/file.pdf",
+            "Other/file.pdf",
+        ],
+    )
+    def test_matches_like_any_fnmatch(self, path: str) -> None:
+        """Union should match iff at least one pattern matches."""
+        expected = any(fnmatch.fnmatchcase(path, p) for p in self.PATTERNS)
+        union = compile_union(self.PATTERNS)
+        assert union is not None
+        assert (union.match(path) is not None) is expected
+
+    @pytest.mark.parametrize(
+        "pattern,path",
+        [
+            ("*/Archive/*", "Liberty/Archive/file.pdf"),
+            ("*/Archive/*", "Liberty/Active/file.pdf"),
+            ("_Archived/*", "_Archived/DB/file.pdf"),
+            ("[ab]*.pdf", "alpha.pdf"),
+            ("*.pdf", "file.PDF"),
+        ],
+    )
+    def test_single_pattern_matches_like_fnmatch(self, pattern: str, path: str) -> None:
+        """A one-pattern union should agree with fnmatch.fnmatch on POSIX."""
+        expected = fnmatch.fnmatchcase(path, pattern)
+        union = compile_union([pattern])
+        assert union is not None
+        assert (union.match(path) is not None) is expected
+
+    def test_matched_index(self) -> None:
+        """matched_index should identify the pattern that matched."""
+        union = compile_union(self.PATTERNS)
+        assert union is not None
+        match = union.match("DB/Week05/file.pdf")
+        assert match is not None
+        assert self.PATTERNS[matched_index(match)] == "*/Week0?/*"
+
+    def test_first_matching_pattern_wins(self) -> None:
+        """With several matches, the earliest pattern should be reported."""
+        union = compile_union(["*.pdf", "Liberty*/*"])
+        assert union is not None
+        match = union.match("Liberty/file.pdf")
+        assert match is not None
+        assert matched_index(match) == 0
+
+    def test_flags(self) -> None:
+        """Flags should apply to every alternative."""
+        union = compile_union(["*.pdf", "*.tmp"], re.IGNORECASE)
+        assert union is not None
+        assert union.match("file.PDF")
+        assert union.match("file.Tmp")
+        assert compile_union(["*.pdf", "*.tmp"]) is not union
+
+    def test_compiled_once(self) -> None:
+        """Equal pattern lists should return the same compiled object."""
+        assert compile_union(["*/A/*", "*/B/*"]) is compile_union(("*/A/*", "*/B/*"))
+
+    def test_empty(self) -> None:
+        """No patterns should compile to None."""
+        assert compile_union([]) is None
@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import errno
+import shutil
+import threading
 from pathlib import Path
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -12,7 +15,7 @@ from rap_importer_plugin.config import (
     ScriptConfig,
     WatchConfig,
 )
-from rap_importer_plugin.pipeline import PipelineManager
+from rap_importer_plugin.pipeline import _TIMING_RE, PipelineManager
 
 
 @pytest.fixture
@@ -340,6 +343,34 @@ class TestArchivedFolderAutoExclude:
         count = pm.global_exclude_paths.count("_Archived/*")
         assert count == 1
 
+    def test_duplicate_patterns_dropped_in_order(
+        self, mock_executor: MagicMock, watch_config: WatchConfig
+    ) -> None:
+        """Duplicate user patterns should collapse, keeping first positions."""
+        pipeline_config = PipelineConfig(scripts=[])
+        pm = PipelineManager(
+            pipeline_config=pipeline_config,
+            watch_config=watch_config,
+            executor=mock_executor,
+            global_exclude_paths=["*/Other/*", "_Archived/*", "*/Other/*"],
+        )
+
+        assert pm.global_exclude_paths == ["*/Other/*", "_Archived/*"]
+
+    def test_archived_files_excluded_only_at_top_level(
+        self, mock_executor: MagicMock, watch_config: WatchConfig
+    ) -> None:
+        """The _Archived/* fast path should match exactly like the pattern."""
+        pm = create_pipeline_manager([], watch_config, mock_executor)
+
+        assert pm._is_globally_excluded("_Archived/Database/file.pdf")
+        assert not pm._is_globally_excluded("Database/_Archived/file.pdf")
+        assert not pm._is_globally_excluded("_archived/Database/file.pdf")
+
+        # Replacing the patterns without _Archived/* disables the fast path
+        pm.global_exclude_paths = ["*/Other/*"]
+        assert not pm._is_globally_excluded("_Archived/Database/file.pdf")
+
 
 class TestArchiveFile:
     """Tests for file archiving functionality."""
@@ -395,6 +426,23 @@ class TestArchiveFile:
 
         assert result == archive_dir / "document-002.pdf"
 
+    def test_get_unique_archive_path_ignores_case(
+        self, tmp_path: Path, mock_executor: MagicMock
+    ) -> None:
+        """Should skip suffixes taken by names differing only in case."""
+        watch_config = WatchConfig(base_folder=str(tmp_path))
+        pm = create_pipeline_manager([], watch_config, mock_executor)
+
+        archive_dir = tmp_path / "_Archived" / "Database"
+        archive_dir.mkdir(parents=True)
+
+        (archive_dir / "document.pdf").write_text("original")
+        (archive_dir / "Document-000.pdf").write_text("first copy")
+
+        result = pm._get_unique_archive_path(archive_dir, "document.pdf")
+
+        assert result == archive_dir / "document-001.pdf"
+
     def test_get_unique_archive_path_preserves_extension(
         self, tmp_path: Path, mock_executor: MagicMock
     ) -> None:
@@ -479,6 +527,49 @@ class TestArchiveFile:
         assert (archive_dir / "document.pdf").read_text() == "first content"
         assert (archive_dir / "document-000.pdf").read_text() == "second content"
 
+    def test_archive_file_recreates_removed_directory(
+        self, tmp_path: Path, mock_executor: MagicMock
+    ) -> None:
+        """Should recreate an archive folder deleted after first use."""
+        watch_config = WatchConfig(base_folder=str(tmp_path))
+        pm = create_pipeline_manager([], watch_config, mock_executor)
+
+        source_dir = tmp_path / "Database"
+        source_dir.mkdir(parents=True)
+
+        file1 = source_dir / "first.pdf"
+        file1.write_text("first")
+        pm._archive_file(file1)
+
+        shutil.rmtree(tmp_path / "_Archived")
+
+        file2 = source_dir / "second.pdf"
+        file2.write_text("second")
+        pm._archive_file(file2)
+
+        assert not file2.exists()
+        assert (tmp_path / "_Archived" / "Database" / "second.pdf").exists()
+
+    def test_archive_file_falls_back_across_filesystems(
+        self, tmp_path: Path, mock_executor: MagicMock
+    ) -> None:
+        """Should copy the file when a rename fails with EXDEV."""
+        watch_config = WatchConfig(base_folder=str(tmp_path))
+        pm = create_pipeline_manager([], watch_config, mock_executor)
+
+        source_dir = tmp_path / "Database"
+        source_dir.mkdir(parents=True)
+        source_file = source_dir / "document.pdf"
+        source_file.write_text("content")
+
+        cross_device = OSError(errno.EXDEV, "Invalid cross-device link")
+        with patch("rap_importer_plugin.pipeline.os.replace", side_effect=cross_device):
+            pm._archive_file(source_file)
+
+        assert not source_file.exists()
+        archived = tmp_path / "_Archived" / "Database" / "document.pdf"
+        assert archived.read_text() == "content"
+
 
 class TestActiveProcessing:
     """Tests for active processing counter."""
@@ -493,19 +584,137 @@ class TestActiveProcessing:
     def test_active_processing_is_thread_safe(
         self, mock_executor: MagicMock, watch_config: WatchConfig
     ) -> None:
-        """Active processing property should use lock for thread safety."""
+        """Active processing count should stay balanced across threads."""
         pm = create_pipeline_manager([], watch_config, mock_executor)
 
-        # Verify lock exists
-        assert hasattr(pm, "_active_lock")
-        assert pm._active_processing == 0
+        # Simulate what process_file does around each run
+        def worker() -> None:
+            for _ in range(1000):
+                pm._active.append(None)
+                pm._active.pop()
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert pm.active_processing == 0
 
-        # Manually increment (simulating what process_file does)
-        with pm._active_lock:
-            pm._active_processing += 1
-        assert pm.active_processing == 1
+    def test_active_processing_tracks_run(
+        self, mock_executor: MagicMock, watch_config: WatchConfig
+    ) -> None:
+        """Active processing should be non-zero while a script is running."""
+        script = ScriptConfig(name="Manual", type="command", path="true")
+        pm = create_pipeline_manager([script], watch_config, mock_executor)
 
-        # Decrement
-        with pm._active_lock:
-            pm._active_processing -= 1
+        seen: list[int] = []
+
+        def execute(*_args: object) -> MagicMock:
+            seen.append(pm.active_processing)
+            return MagicMock(success=True, output="", stderr="", duration_ms=0)
+
+        mock_executor.execute.side_effect = execute
+        assert pm.run_manual() is True
+        assert seen == [1]
         assert pm.active_processing == 0
+
+
+class TestFailedCount:
+    """Tests for failed file counter."""
+
+    def test_failed_count_tracks_unique_files(
+        self, mock_executor: MagicMock, watch_config: WatchConfig
+    ) -> None:
+        """Failed count should count distinct failed files, not attempts."""
+        pm = create_pipeline_manager([], watch_config, mock_executor)
+        assert pm.failed_count == 0
+
+        pm._record_failure("/tmp/a.pdf")
+        pm._record_failure("/tmp/a.pdf")
+        pm._record_failure("/tmp/b.pdf")
+        assert pm.failed_count == 2
+        assert pm.failed_count == len(pm.get_failed_files())
+
+        pm.reset_failures()
+        assert pm.failed_count == 0
+
+
+class TestFilesProcessed:
+    """Tests for the files processed counter."""
+
+    def test_counts_across_threads(
+        self, mock_executor: MagicMock, watch_config: WatchConfig
+    ) -> None:
+        """Increments from several threads should all be counted."""
+        pm = create_pipeline_manager([], watch_config, mock_executor)
+        assert pm.files_processed == 0
+
+        def worker() -> None:
+            for _ in range(500):
+                pm._increment_processed()
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        pm._increment_processed()
+
+        assert pm.files_processed == 2001
+
+
+class TestRelativeToBase:
+    """Tests for relative path computation against the base folder."""
+
+    def test_inside_and_outside_base(
+        self, tmp_path: Path, mock_executor: MagicMock
+    ) -> None:
+        """Should strip the base folder and reject sibling folders sharing a prefix."""
+        base = tmp_path / "RAP"
+        watch_config = WatchConfig(base_folder=str(base))
+        pm = create_pipeline_manager([], watch_config, mock_executor)
+
+        assert pm._relative_to_base(str(base / "DB" / "file.pdf")) == "DB/file.pdf"
+        assert pm._relative_to_base(str(tmp_path / "RAP2" / "file.pdf")) is None
+        assert pm._relative_to_base(str(tmp_path / "file.pdf")) is None
+
+
+class TestProcessFileFiltering:
+    """Tests for path filtering inside process_file."""
+
+    def test_skips_variables_when_no_script_matches(
+        self, tmp_path: Path, mock_executor: MagicMock
+    ) -> None:
+        """No FileVariables should be built when every script is filtered out."""
+        watch_config = WatchConfig(base_folder=str(tmp_path))
+        scripts = [
+            ScriptConfig(
+                name="Liberty Only",
+                type="python",
+                path="test.py",
+                include_paths=["Liberty*/*"],
+            )
+        ]
+        pm = create_pipeline_manager(scripts, watch_config, mock_executor)
+
+        source_dir = tmp_path / "Other"
+        source_dir.mkdir()
+        source_file = source_dir / "document.pdf"
+        source_file.write_text("content")
+
+        with patch("rap_importer_plugin.pipeline.FileVariables.from_file") as from_file:
+            assert pm.process_file(source_file) is False
+
+        from_file.assert_not_called()
+        mock_executor.execute.assert_not_called()
+        assert source_file.exists()
+
+
+class TestTimingLines:
+    """Tests for TIMING line extraction from script stderr."""
+
+    def test_finds_timing_lines(self) -> None:
+        """Only lines starting with TIMING: should match, without line endings."""
+        stderr = "warning\nTIMING: import 1.2s\r\nnot TIMING: here\nTIMING: total 3s"
+        lines = [m.group() for m in _TIMING_RE.finditer(stderr)]
+        assert lines == ["TIMING: import 1.2s", "TIMING: total 3s"]
@@ -9,20 +9,19 @@ import pytest
 from jsonschema import Draft7Validator, ValidationError, validate
 
 
-@pytest.fixture
+# Session-scoped: tests only read these dicts, never mutate them
+@pytest.fixture(scope="session")
 def schema() -> dict:
     """Load the config schema."""
     schema_path = Path(__file__).parent.parent / "config" / "config.schema.json"
-    with open(schema_path) as f:
-        return json.load(f)
+    return json.loads(schema_path.read_bytes())
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def config() -> dict:
     """Load the actual config file."""
     config_path = Path(__file__).parent.parent / "config" / "config.json"
-    with open(config_path) as f:
-        return json.load(f)
+    return json.loads(config_path.read_bytes())
 
 
 class TestSchemaValidity:
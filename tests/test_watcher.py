@@ -2,10 +2,19 @@
 
 from __future__ import annotations
 
+import os
+import time
 from pathlib import Path
+from typing import Callable, Iterator
 from unittest.mock import MagicMock
 
 import pytest
+from watchdog.events import (
+    DirCreatedEvent,
+    FileClosedEvent,
+    FileCreatedEvent,
+    FileModifiedEvent,
+)
 
 from rap_importer_plugin.config import WatchConfig
 from rap_importer_plugin.watcher import StabilityCheckHandler, scan_existing_files
@@ -24,34 +33,33 @@ def watch_config() -> WatchConfig:
 class TestCaseInsensitivePatterns:
     """Tests for case-insensitive file pattern matching."""
 
-    def test_matches_lowercase_extension(self, watch_config: WatchConfig) -> None:
+    @pytest.fixture
+    def handler(self, watch_config: WatchConfig) -> StabilityCheckHandler:
+        """Create a handler with the typical patterns."""
+        return StabilityCheckHandler(watch_config, MagicMock())
+
+    def test_matches_lowercase_extension(self, handler: StabilityCheckHandler) -> None:
         """Pattern *.pdf should match file.pdf."""
-        handler = StabilityCheckHandler(watch_config, MagicMock())
         assert handler._matches_patterns(Path("/tmp/test/document.pdf")) is True
 
-    def test_matches_uppercase_extension(self, watch_config: WatchConfig) -> None:
+    def test_matches_uppercase_extension(self, handler: StabilityCheckHandler) -> None:
         """Pattern *.pdf should match file.PDF (case-insensitive)."""
-        handler = StabilityCheckHandler(watch_config, MagicMock())
         assert handler._matches_patterns(Path("/tmp/test/document.PDF")) is True
 
-    def test_matches_mixed_case_extension(self, watch_config: WatchConfig) -> None:
+    def test_matches_mixed_case_extension(self, handler: StabilityCheckHandler) -> None:
         """Pattern *.pdf should match file.Pdf (case-insensitive)."""
-        handler = StabilityCheckHandler(watch_config, MagicMock())
         assert handler._matches_patterns(Path("/tmp/test/document.Pdf")) is True
 
-    def test_ignores_uppercase_tmp(self, watch_config: WatchConfig) -> None:
+    def test_ignores_uppercase_tmp(self, handler: StabilityCheckHandler) -> None:
         """Ignore pattern *.tmp should also ignore .TMP (case-insensitive)."""
-        handler = StabilityCheckHandler(watch_config, MagicMock())
         assert handler._matches_patterns(Path("/tmp/test/document.TMP")) is False
 
-    def test_ignores_mixed_case_download(self, watch_config: WatchConfig) -> None:
+    def test_ignores_mixed_case_download(self, handler: StabilityCheckHandler) -> None:
         """Ignore pattern *.download should also ignore .DOWNLOAD."""
-        handler = StabilityCheckHandler(watch_config, MagicMock())
         assert handler._matches_patterns(Path("/tmp/test/file.DOWNLOAD")) is False
 
-    def test_no_match_wrong_extension(self, watch_config: WatchConfig) -> None:
+    def test_no_match_wrong_extension(self, handler: StabilityCheckHandler) -> None:
         """Files with non-matching extensions should not match."""
-        handler = StabilityCheckHandler(watch_config, MagicMock())
         assert handler._matches_patterns(Path("/tmp/test/document.doc")) is False
 
 
@@ -101,3 +109,241 @@ class TestScanExistingFilesCaseInsensitive:
         assert "temp.tmp" not in filenames
         assert "temp.TMP" not in filenames
         assert len(files) == 1
+
+
+class TestStabilityScheduling:
+    """Tests for the stability check scheduler."""
+
+    @staticmethod
+    def _wait_for(condition: Callable[[], bool], timeout: float = 5.0) -> bool:
+        """Poll until condition() is true or timeout expires."""
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if condition():
+                return True
+            time.sleep(0.01)
+        return condition()
+
+    @pytest.fixture
+    def make_handler(self) -> Iterator[Callable[..., StabilityCheckHandler]]:
+        """Create handlers whose threads are shut down when the test ends."""
+        handlers: list[StabilityCheckHandler] = []
+
+        def make(
+            config: WatchConfig, on_file_ready: Callable[[Path], None]
+        ) -> StabilityCheckHandler:
+            handler = StabilityCheckHandler(config, on_file_ready)
+            handlers.append(handler)
+            return handler
+
+        yield make
+        for handler in handlers:
+            handler.shutdown()
+
+    def test_stable_files_trigger_callback(
+        self, tmp_path: Path, make_handler: Callable[..., StabilityCheckHandler]
+    ) -> None:
+        """All stable files should be handed off, using one scheduler thread."""
+        config = WatchConfig(
+            base_folder=str(tmp_path),
+            stability_check_seconds=0.01,
+            stability_timeout_seconds=5.0,
+        )
+        ready: list[Path] = []
+        handler = make_handler(config, ready.append)
+
+        files = [tmp_path / f"doc{i}.pdf" for i in range(10)]
+        for file_path in files:
+            file_path.write_text("content")
+            handler._handle_file(str(file_path))
+        worker = handler._worker
+
+        assert self._wait_for(lambda: not handler._pending)
+        assert sorted(ready) == sorted(files)
+        assert handler._worker is worker
+
+    def test_missing_file_is_dropped(
+        self, tmp_path: Path, make_handler: Callable[..., StabilityCheckHandler]
+    ) -> None:
+        """A file deleted before it stabilizes should be dropped without a callback."""
+        config = WatchConfig(
+            base_folder=str(tmp_path),
+            stability_check_seconds=0.01,
+            stability_timeout_seconds=5.0,
+        )
+        callback = MagicMock()
+        handler = make_handler(config, callback)
+
+        handler._handle_file(str(tmp_path / "gone.pdf"))
+
+        assert self._wait_for(lambda: not handler._pending)
+        callback.assert_not_called()
+
+    def test_closed_file_skips_repeat_check(
+        self, tmp_path: Path, make_handler: Callable[..., StabilityCheckHandler]
+    ) -> None:
+        """A file closed by its writer should be ready on its first check."""
+        config = WatchConfig(
+            base_folder=str(tmp_path),
+            stability_check_seconds=10.0,
+            stability_timeout_seconds=60.0,
+        )
+        ready: list[Path] = []
+        handler = make_handler(config, ready.append)
+
+        file_path = tmp_path / "document.pdf"
+        file_path.write_text("content")
+        handler.dispatch(FileClosedEvent(str(file_path)))
+
+        assert self._wait_for(lambda: not handler._pending)
+        assert ready == [file_path]
+
+    def test_shutdown_clears_pending(
+        self, tmp_path: Path, make_handler: Callable[..., StabilityCheckHandler]
+    ) -> None:
+        """shutdown() should stop the scheduler and forget pending files."""
+        config = WatchConfig(
+            base_folder=str(tmp_path),
+            stability_check_seconds=10.0,
+            stability_timeout_seconds=60.0,
+        )
+        handler = make_handler(config, MagicMock())
+
+        file_path = tmp_path / "document.pdf"
+        file_path.write_text("content")
+        handler._handle_file(str(file_path))
+        assert str(file_path) in handler._pending
+
+        worker = handler._worker
+        assert worker is not None
+        handler.shutdown()
+
+        assert not handler._pending
+        assert not handler._checks
+        worker.join(timeout=1.0)
+        assert not worker.is_alive()
+
+
+class TestDispatchFiltering:
+    """Tests for event filtering before dispatch."""
+
+    def test_drops_ignored_and_directory_events(self, watch_config: WatchConfig) -> None:
+        """Only matching file events should reach _handle_file."""
+        handler = StabilityCheckHandler(watch_config, MagicMock())
+        handler._handle_file = MagicMock()  # type: ignore[method-assign]
+
+        handler.dispatch(FileCreatedEvent("/tmp/test/partial.pdf.download"))
+        handler.dispatch(FileCreatedEvent("/tmp/test/notes.doc"))
+        handler.dispatch(DirCreatedEvent("/tmp/test/folder.pdf"))
+        handler._handle_file.assert_not_called()
+
+        handler.dispatch(FileCreatedEvent("/tmp/test/document.PDF"))
+        handler._handle_file.assert_called_once_with("/tmp/test/document.PDF")
+
+    def test_debounces_modified_events(self, watch_config: WatchConfig) -> None:
+        """A burst of modified events should only be handled once."""
+        handler = StabilityCheckHandler(watch_config, MagicMock())
+        handler._handle_file = MagicMock()  # type: ignore[method-assign]
+
+        for _ in range(100):
+            handler.dispatch(FileModifiedEvent("/tmp/test/document.pdf"))
+        handler._handle_file.assert_called_once()
+
+        handler._finish("/tmp/test/document.pdf")
+        assert handler._last_event == {}
+
+
+class TestScanExistingFilesOrder:
+    """Tests for scan_existing_files traversal and ordering."""
+
+    def test_scan_recurses_and_sorts_by_mtime(self, tmp_path: Path) -> None:
+        """Files in subfolders should be found and returned oldest first."""
+        config = WatchConfig(
+            base_folder=str(tmp_path),
+            file_patterns=["*.pdf"],
+            ignore_patterns=[],
+        )
+
+        newest = tmp_path / "newest.pdf"
+        oldest = tmp_path / "DB" / "Group" / "oldest.pdf"
+        middle = tmp_path / "DB" / "middle.pdf"
+        for i, file_path in enumerate([oldest, middle, newest]):
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            file_path.touch()
+            os.utime(file_path, (1_000_000 + i, 1_000_000 + i))
+
+        assert scan_existing_files(config) == [oldest, middle, newest]
+
+    def test_scan_many_subfolders_in_parallel(self, tmp_path: Path) -> None:
+        """Wide trees walked on the thread pool should give the same result."""
+        config = WatchConfig(
+            base_folder=str(tmp_path),
+            file_patterns=["*.pdf"],
+            ignore_patterns=["*.tmp"],
+        )
+
+        expected = []
+        for i in range(20):
+            folder = tmp_path / f"DB{i:02d}" / "Group"
+            folder.mkdir(parents=True)
+            (folder / "skip.tmp").touch()
+            file_path = folder / "doc.pdf"
+            file_path.touch()
+            # Oldest in the last folder, so the order isn't the walk order
+            os.utime(file_path, (2_000_000 - i, 2_000_000 - i))
+            expected.insert(0, file_path)
+
+        assert scan_existing_files(config) == expected
+
+
+class TestMixedPatterns:
+    """Tests for extension-only patterns combined with general globs."""
+
+    @pytest.fixture
+    def handler(self) -> StabilityCheckHandler:
+        """Create a handler with extension-only and general patterns."""
+        config = WatchConfig(
+            base_folder="/tmp/test",
+            file_patterns=["*.pdf", "Scan_*"],
+            ignore_patterns=["*.tmp", "~$*"],
+        )
+        return StabilityCheckHandler(config, MagicMock())
+
+    @pytest.mark.parametrize(
+        "filename,expected",
+        [
+            ("report.PDF", True),
+            ("Scan_0001.jpg", True),
+            ("scan_0001.jpg", True),
+            ("report.pdf.tmp", False),
+            ("~$report.pdf", False),
+            ("pdf", False),
+            (".pdf", True),
+            ("report.pdfx", False),
+        ],
+    )
+    def test_matches(
+        self, handler: StabilityCheckHandler, filename: str, expected: bool
+    ) -> None:
+        """Extension lookups and regex patterns should agree with fnmatch."""
+        assert handler._matches_patterns(Path("/tmp/test") / filename) is expected
+
+    @pytest.mark.parametrize(
+        "filename,expected",
+        [
+            ("report.pdf", True),
+            ("report.PDF.Download", False),
+            ("report.pdf.part", False),
+            ("archive.tar.pdf", True),
+            ("notes.download.pdf", True),
+        ],
+    )
+    def test_multi_part_suffixes(self, filename: str, expected: bool) -> None:
+        """Multi-part suffix patterns should match like fnmatch, ignoring case."""
+        config = WatchConfig(
+            base_folder="/tmp/test",
+            file_patterns=["*.pdf"],
+            ignore_patterns=["*.pdf.download", "*.part"],
+        )
+        handler = StabilityCheckHandler(config, MagicMock())
+        assert handler._matches_patterns(Path("/tmp/test") / filename) is expected